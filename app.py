@@ -1,6 +1,7 @@
 import streamlit as st
 import pandas as pd
 import numpy as np
+from dataclasses import dataclass
 import plotly.express as px
 import plotly.graph_objects as go
 
@@ -12,6 +13,199 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Cached DataFrame summaries
+# Every widget interaction reruns this script, so the O(rows) summaries below are
+# computed once per loaded frame and kept in session state next to that frame.
+# Holding the frame itself (not its id) means a new frame can never match.
+def _summary(df, name, compute):
+    entry = st.session_state.get('df_summaries')
+    if entry is None or entry[0] is not df:
+        entry = st.session_state['df_summaries'] = (df, {})
+    cache = entry[1]
+    if name not in cache:
+        cache[name] = compute(df)
+    return cache[name]
+
+def describe_df(df):
+    return _summary(df, 'describe', lambda d: d.describe())
+
+def missing_counts(df):
+    return _summary(df, 'missing', lambda d: d.isnull().sum())
+
+def dtype_summary(df):
+    return _summary(df, 'dtypes', lambda d: pd.DataFrame({
+        'Column': d.columns,
+        'Data Type': d.dtypes.values,
+        'Non-Null Count': d.count().values,
+        'Null Count': d.isnull().sum().values
+    }))
+
+def memory_mb(df):
+    return _summary(df, 'memory_mb', lambda d: d.memory_usage(deep=True).sum() / 1024**2)
+
+# Column-type index
+# Built once per loaded frame and kept in session state, so pages look up column
+# types instead of walking df.dtypes / select_dtypes on every rerun.
+@dataclass(frozen=True)
+class ColumnIndex:
+    numeric: list
+    categorical: list
+    dtypes: list  # [(column, dtype), ...]
+
+def build_column_index(df):
+    return ColumnIndex(
+        numeric=df.select_dtypes(include=[np.number]).columns.tolist(),
+        categorical=df.select_dtypes(include=['object']).columns.tolist(),
+        dtypes=list(df.dtypes.items()),
+    )
+
+def column_index(df):
+    """ColumnIndex for `df`; rebuilt only when a different frame is passed."""
+    entry = st.session_state.get('col_index')
+    if entry is None or entry[0] is not df:
+        # Holding the frame itself (not its id) means a new frame can never match
+        entry = st.session_state['col_index'] = (df, build_column_index(df))
+    return entry[1]
+
+# Paged table view
+# st.dataframe serializes every row it is given, so large frames are shown one
+# page at a time. Slicing a page is O(page size) and is not cached: the filtered
+# frame is a new object on each rerun, so an identity key could serve a stale page.
+PAGE_ROWS = 100
+
+def paged_dataframe(df, key):
+    """Render `df` one page at a time when it has more than PAGE_ROWS rows."""
+    if len(df) <= PAGE_ROWS:
+        st.dataframe(df, use_container_width=True)
+        return
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        rows = int(st.number_input(
+            "Rows per page", min_value=10, max_value=5000, value=PAGE_ROWS, step=50, key=f"{key}_rows"
+        ))
+    n_pages = -(-len(df) // rows)
+    page_key = f"{key}_page"
+    # Keep the current page in range when the page size grows
+    st.session_state[page_key] = min(st.session_state.get(page_key, 1), n_pages)
+    with col2:
+        page_num = int(st.number_input(
+            f"Page (of {n_pages:,})", min_value=1, max_value=n_pages, key=page_key
+        ))
+    
+    start = (page_num - 1) * rows
+    stop = min(start + rows, len(df))
+    st.caption(f"Rows {start + 1:,}–{stop:,} of {len(df):,}")
+    st.dataframe(df.iloc[start:stop], use_container_width=True)
+
+# Downsampling
+# Line/scatter charts above MAX_CHART_POINTS are reduced with LTTB
+# (Largest-Triangle-Three-Buckets), which keeps the visual shape of the series
+# while sending far fewer points to the browser.
+MAX_CHART_POINTS = 5_000
+DOWNSAMPLED_POINTS = 2_000
+
+def lttb_indices(x, y, n_out):
+    """Return indices of the `n_out` points LTTB keeps from (x, y)."""
+    n = len(x)
+    if n <= n_out or n_out < 3:
+        return np.arange(n)
+    
+    # n_out - 2 buckets between the fixed first and last points
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        # Twice the triangle area formed with the previous pick and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(area.argmax())
+        keep[i + 1] = a
+    return keep
+
+def chart_points(df, x_column, y_column, sort_x=False):
+    """x/y arrays for a line or scatter trace, downsampled when too large."""
+    x = df[x_column].to_numpy(dtype=np.float64)
+    y = df[y_column].to_numpy(dtype=np.float64)
+    if len(x) <= MAX_CHART_POINTS:
+        return x, y, False
+    
+    finite = np.isfinite(x) & np.isfinite(y)
+    x, y = x[finite], y[finite]
+    if sort_x:
+        order = np.argsort(x, kind='stable')
+        x, y = x[order], y[order]
+    idx = lttb_indices(x, y, DOWNSAMPLED_POINTS)
+    return x[idx], y[idx], True
+
+# Main chart
+# One figure is kept in session state and its trace is updated in place, so
+# swapping columns doesn't rebuild the figure. A new trace is only created when
+# the chart type changes.
+CHART_TRACES = {
+    "Scatter Plot": lambda: go.Scatter(mode="markers"),
+    "Line Chart": lambda: go.Scatter(mode="lines"),
+    "Bar Chart": go.Bar,
+    "Histogram": go.Histogram,
+}
+
+def main_chart(df, chart_type, x_column, y_column):
+    fig = st.session_state.get('main_fig')
+    if fig is None or st.session_state.get('main_fig_type') != chart_type:
+        fig = go.Figure(CHART_TRACES[chart_type]())
+        st.session_state['main_fig'] = fig
+        st.session_state['main_fig_type'] = chart_type
+    
+    trace = fig.data[0]
+    if chart_type == "Histogram":
+        trace.x = df[x_column].to_numpy()
+        title, y_title = f"Distribution of {x_column}", "count"
+    else:
+        if chart_type in ("Scatter Plot", "Line Chart"):
+            trace.x, trace.y, downsampled = chart_points(
+                df, x_column, y_column, sort_x=(chart_type == "Scatter Plot")
+            )
+            if downsampled:
+                st.caption(f"Showing {len(trace.x):,} of {len(df):,} points (LTTB downsampled)")
+        else:
+            trace.x = df[x_column].to_numpy()
+            trace.y = df[y_column].to_numpy()
+        y_title = y_column
+        title = {
+            "Scatter Plot": f"{y_column} vs {x_column}",
+            "Line Chart": f"{y_column} over {x_column}",
+            "Bar Chart": f"{y_column} by {x_column}",
+        }[chart_type]
+    fig.update_layout(title=title, xaxis_title=x_column, yaxis_title=y_title)
+    return fig
+
+# CSV loading
+# Files up to FULL_LOAD_BYTES are read in full straight away. Larger files only
+# materialize a preview chunk until the user asks for the full load.
+FULL_LOAD_BYTES = 50 * 1024**2
+
+def preview_chunksize(size_bytes):
+    """Rows to read for the preview; fewer rows as the file gets bigger."""
+    if size_bytes <= 200 * 1024**2:
+        return 10_000
+    if size_bytes <= 1024**3:
+        return 5_000
+    return 1_000
+
+def read_csv_preview(file, size_bytes):
+    file.seek(0)
+    with pd.read_csv(file, chunksize=preview_chunksize(size_bytes), engine='c') as reader:
+        return reader.get_chunk()
+
+def read_csv_full(file):
+    """Read the whole CSV with pandas, so dtypes match the preview and earlier loads."""
+    file.seek(0)
+    return pd.read_csv(file, engine='c')
+
 # Main title
 st.title("📊 Minimal Data Visualization App")
 st.markdown("---")
@@ -73,11 +267,31 @@ elif page == "Data Upload":
     
     if uploaded_file is not None:
         try:
-            # Read the uploaded file
-            df = pd.read_csv(uploaded_file)
+            # Read the uploaded file once; reruns reuse what is in session state.
+            # file_id changes on every upload, even for an edited file with the
+            # same name and size.
+            file_key = uploaded_file.file_id
+            if st.session_state.get('data_file') != file_key:
+                st.session_state.pop('data', None)
+                st.session_state.pop('data_preview', None)
+                if uploaded_file.size <= FULL_LOAD_BYTES:
+                    st.session_state['data'] = read_csv_full(uploaded_file)
+                else:
+                    st.session_state['data_preview'] = read_csv_preview(uploaded_file, uploaded_file.size)
+                st.session_state['data_file'] = file_key
             
-            # Store in session state
-            st.session_state['data'] = df
+            if 'data' not in st.session_state:
+                st.info(
+                    f"Large file ({uploaded_file.size / 1024**2:.0f} MB): showing the first "
+                    f"{len(st.session_state['data_preview']):,} rows."
+                )
+                if st.button("Load Full File"):
+                    st.session_state['data'] = read_csv_full(uploaded_file)
+                    st.session_state.pop('data_preview', None)
+            
+            df = st.session_state.get('data')
+            if df is None:
+                df = st.session_state['data_preview']
             
             st.success(f"✅ File uploaded successfully! Shape: {df.shape}")
             
@@ -94,10 +308,10 @@ elif page == "Data Upload":
                 st.write("**Dataset Info:**")
                 st.write(f"- Rows: {df.shape[0]}")
                 st.write(f"- Columns: {df.shape[1]}")
-                st.write(f"- Memory usage: {df.memory_usage(deep=True).sum() / 1024**2:.2f} MB")
+                st.write(f"- Memory usage: {memory_mb(df):.2f} MB")
                 
                 st.write("**Column Types:**")
-                for col, dtype in df.dtypes.items():
+                for col, dtype in column_index(df).dtypes:
                     st.write(f"- {col}: {dtype}")
         
         except Exception as e:
@@ -115,19 +329,20 @@ elif page == "Sample Charts":
         st.subheader("Interactive Visualizations")
         
         # Get numeric columns
-        numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
-        categorical_columns = df.select_dtypes(include=['object']).columns.tolist()
+        col_index = column_index(df)
+        numeric_cols = col_index.numeric
+        categorical_cols = col_index.categorical
         
-        if numeric_columns:
+        if numeric_cols:
             col1, col2 = st.columns(2)
             
             with col1:
                 st.write("**Select X-axis:**")
-                x_column = st.selectbox("X-axis", numeric_columns, key="x_axis")
+                x_column = st.selectbox("X-axis", numeric_cols, key="x_axis")
             
             with col2:
                 st.write("**Select Y-axis:**")
-                y_column = st.selectbox("Y-axis", numeric_columns, key="y_axis")
+                y_column = st.selectbox("Y-axis", numeric_cols, key="y_axis")
             
             # Chart type selection
             chart_type = st.selectbox(
@@ -135,22 +350,14 @@ elif page == "Sample Charts":
                 ["Scatter Plot", "Line Chart", "Bar Chart", "Histogram"]
             )
             
-            # Generate chart based on selection
-            if chart_type == "Scatter Plot":
-                fig = px.scatter(df, x=x_column, y=y_column, title=f"{y_column} vs {x_column}")
-            elif chart_type == "Line Chart":
-                fig = px.line(df, x=x_column, y=y_column, title=f"{y_column} over {x_column}")
-            elif chart_type == "Bar Chart":
-                fig = px.bar(df, x=x_column, y=y_column, title=f"{y_column} by {x_column}")
-            elif chart_type == "Histogram":
-                fig = px.histogram(df, x=x_column, title=f"Distribution of {x_column}")
-            
-            st.plotly_chart(fig, use_container_width=True)
+            # Update the persisted chart for the current selection
+            fig = main_chart(df, chart_type, x_column, y_column)
+            st.plotly_chart(fig, key="main_chart", use_container_width=True)
             
             # Additional chart if categorical columns exist
-            if categorical_columns:
+            if categorical_cols:
                 st.subheader("Categorical Analysis")
-                cat_column = st.selectbox("Select categorical column", categorical_columns)
+                cat_column = st.selectbox("Select categorical column", categorical_cols)
                 
                 if cat_column:
                     value_counts = df[cat_column].value_counts()
@@ -193,21 +400,15 @@ elif page == "Data Analysis":
         
         with tab1:
             st.write("**Descriptive Statistics:**")
-            st.dataframe(df.describe())
+            st.dataframe(describe_df(df))
         
         with tab2:
             st.write("**Data Types:**")
-            dtype_df = pd.DataFrame({
-                'Column': df.columns,
-                'Data Type': df.dtypes.values,
-                'Non-Null Count': df.count().values,
-                'Null Count': df.isnull().sum().values
-            })
-            st.dataframe(dtype_df)
+            st.dataframe(dtype_summary(df))
         
         with tab3:
             st.write("**Missing Values Analysis:**")
-            missing_data = df.isnull().sum()
+            missing_data = missing_counts(df)
             missing_data = missing_data[missing_data > 0].sort_values(ascending=False)
             
             if len(missing_data) > 0:
@@ -225,10 +426,10 @@ elif page == "Data Analysis":
         st.subheader("Data Filtering")
         
         with st.expander("Filter Data"):
-            numeric_columns = df.select_dtypes(include=[np.number]).columns.tolist()
+            numeric_cols = column_index(df).numeric
             
-            if numeric_columns:
-                filter_column = st.selectbox("Select column to filter", numeric_columns)
+            if numeric_cols:
+                filter_column = st.selectbox("Select column to filter", numeric_cols)
                 
                 if filter_column:
                     min_val = float(df[filter_column].min())
@@ -247,11 +448,11 @@ elif page == "Data Analysis":
                     ]
                     
                     st.write(f"**Filtered Data ({len(filtered_df)} rows):**")
-                    st.dataframe(filtered_df)
+                    paged_dataframe(filtered_df, key="filtered")
         
         # Raw data view
         st.subheader("Raw Data")
-        st.dataframe(df, use_container_width=True)
+        paged_dataframe(df, key="raw")
     
     else:
         st.info("📁 Please upload data in the 'Data Upload' section first")
@@ -1,4 +1,9 @@
 #!/usr/bin/env python3
+import queue
+import random
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from work_loads.url_generator import generate_urls
 from work_loads.en_word_generator import generate_random_words, gen_words_with_prefix_freq
 
@@ -6,6 +11,10 @@ from work_loads.en_word_generator import generate_random_words, gen_words_with_p
 class WorkLoad:
     def __init__(self, seed=None):
         self.seed = seed
+        self._url_queue = None
+        self._url_buf = []
+        self._stop = None
+        self._producer = None
 
     def words(self, num_words, p_freq=0, unique=False):
         if p_freq > 0:
@@ -14,5 +23,71 @@ class WorkLoad:
             return generate_random_words(num_words, self.seed, unique)
 
     def urls(self, num_urls):
-        return generate_urls(num_urls, self.seed)
-        
\ No newline at end of file
+        if self._url_queue is None:
+            return generate_urls(num_urls, self.seed)
+        # Serve from prefetched batches, keeping any leftover for the next call
+        out = self._url_buf
+        while len(out) < num_urls:
+            batch = self._url_queue.get()
+            if isinstance(batch, BaseException):
+                # The producer failed and stopped; surface its error here
+                self.stop_prefetch()
+                raise batch
+            out.extend(batch)
+        self._url_buf = out[num_urls:]
+        return out[:num_urls]
+
+    def prefetch_urls(self, batch=4096, workers=2):
+        """Start generating URLs in the background so `urls()` returns from a queue.
+
+        A producer thread keeps `workers` batches of `batch` URLs in flight on a
+        process pool (URL generation is CPU-bound Python, so processes sidestep the
+        GIL) and queues finished batches in order. Batch seeds are drawn from
+        `self.seed`, so a seeded WorkLoad yields the same URL stream every run.
+        Call `stop_prefetch()` to shut the pool down. If generating a batch
+        fails, prefetching stops and the next `urls()` call re-raises the error.
+        """
+        if self._url_queue is not None:
+            return
+        if batch <= 0 or workers <= 0:
+            raise ValueError("batch and workers must be positive")
+        self._url_queue = queue.Queue(maxsize=2 * workers)
+        self._stop = threading.Event()
+        self._producer = threading.Thread(
+            target=self._produce_urls, args=(batch, workers), daemon=True)
+        self._producer.start()
+
+    def stop_prefetch(self):
+        if self._url_queue is None:
+            return
+        self._stop.set()
+        self._producer.join()
+        self._url_queue = self._stop = self._producer = None
+        self._url_buf = []
+
+    def _produce_urls(self, batch, workers):
+        try:
+            seeds = random.Random(self.seed)
+            with ProcessPoolExecutor(max_workers=workers) as ex:
+                pending = deque(
+                    ex.submit(generate_urls, batch, seeds.getrandbits(64)) for _ in range(workers))
+                try:
+                    while not self._stop.is_set():
+                        urls = pending.popleft().result()
+                        pending.append(ex.submit(generate_urls, batch, seeds.getrandbits(64)))
+                        self._put(urls)
+                finally:
+                    for f in pending:
+                        f.cancel()
+        except BaseException as exc:
+            # Hand the error to the consumer instead of dying silently, which
+            # would leave `urls()` blocked on an empty queue forever
+            self._put(exc)
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._url_queue.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
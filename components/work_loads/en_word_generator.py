@@ -1,25 +1,51 @@
 import random
 import math
-import os
-from collections import defaultdict
+import numpy as np
+from .sampling import WeightedSampler
+from .words_data import load_words, word_list
 
-# Load word lists
-FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+# Load word lists (shared with url_generator, decoded once per process)
+WORDS_COMMON = word_list("words_common.txt")
+_BROAD = load_words("words_alpha.txt")
+WORDS_BROAD = word_list("words_alpha.txt")   # _BROAD.tolist(), cached per name
 
-with open(os.path.join(FILE_DIR, "words_common.txt"), "r", encoding="utf-8") as f:
-    WORDS_COMMON = [w for w in f.read().splitlines() if w]
 
-with open(os.path.join(FILE_DIR, "words_alpha.txt"), "r", encoding="utf-8") as f:
-    WORDS_BROAD = [w for w in f.read().splitlines() if w]
+def _prefix_keys(wl):
+  """Key each word of WordList `wl` by its first two characters as (c0 << 21) | (c1 + 1)
+  (0 for one-letter words). Code points fit in 21 bits, so the uint64 keys are
+  collision-free for any text. For an ASCII file the keys are read straight from
+  the mmap'd bytes; otherwise the words are decoded from `wl` itself."""
+  buf = np.frombuffer(wl.blob, dtype=np.uint8)
+  if len(buf) == 0 or buf.max() < 128:
+    second = np.where(wl.ends - wl.starts > 1,
+                      buf[np.minimum(wl.starts + 1, max(len(buf) - 1, 0))].astype(np.uint64) + 1, 0)
+    return (buf[wl.starts].astype(np.uint64) << 21) | second
+  words = wl.tolist()
+  return np.fromiter(((ord(w[0]) << 21) | (ord(w[1]) + 1 if len(w) > 1 else 0) for w in words),
+                     dtype=np.uint64, count=len(words))
 
 
-## Created dictionary for words with identical first two letters
-## This is to generate words with common prefixes
-prefix_bucket = defaultdict(list)
-for word in WORDS_BROAD:
-  prefix_bucket[word[:2]].append(word)
-prefixes = list(prefix_bucket.keys())
-prefix_weights = [len(prefix_bucket[p]) for p in prefixes]
+## Words with identical first two letters are grouped into buckets (in order of
+## first appearance) to generate words with common prefixes. Buckets are stored
+## flattened (SoA): bucket p holds words_arr[bucket_offsets[p]:bucket_offsets[p] + bucket_sizes[p]]
+_keys = _prefix_keys(_BROAD)
+_uniq, _first, _inverse, _counts = np.unique(
+  _keys, return_index=True, return_inverse=True, return_counts=True)
+_rank = np.argsort(_first)
+_bucket_of = np.empty_like(_rank)
+_bucket_of[_rank] = np.arange(len(_rank))
+_order = np.argsort(_bucket_of[_inverse], kind="stable")
+
+words_arr = np.empty(len(WORDS_BROAD), dtype=object)
+words_arr[:] = WORDS_BROAD
+words_arr = words_arr[_order]
+prefixes = [WORDS_BROAD[i][:2] for i in _first[_rank].tolist()]
+bucket_sizes = _counts[_rank].astype(np.int64)
+bucket_offsets = np.zeros(len(prefixes), dtype=np.int64)
+np.cumsum(bucket_sizes[:-1], out=bucket_offsets[1:])
+prefix_weights = bucket_sizes.tolist()
+PREFIX_SAMPLER = WeightedSampler(prefixes, prefix_weights)
+del _keys, _uniq, _first, _inverse, _counts, _rank, _bucket_of, _order
 
 
 def generate_random_words(num_words, seed=None, unique=False):
@@ -60,6 +86,8 @@ def gen_words_with_prefix_freq(num_words, prefix_freq=0.0, seed=None, unique=Fal
     raise ValueError(f"num_words must be between 1 and {max_unique}")
   if prefix_freq < 0 or prefix_freq >= 1:
     raise ValueError("prefix_freq must be between 0 and 1")
+  if not unique:
+    return _clustered_words(num_words, prefix_freq, np.random.default_rng(seed))
   rng = random.Random(seed)
     
   rand_words_list = []
@@ -68,8 +96,9 @@ def gen_words_with_prefix_freq(num_words, prefix_freq=0.0, seed=None, unique=Fal
     exhausted = set()
     
   while len(rand_words_list) < num_words:
-    prefix = rng.choices(prefixes, weights=prefix_weights)[0]
-    options = prefix_bucket[prefix]
+    prefix = PREFIX_SAMPLER.draw_index(rng)
+    start = bucket_offsets[prefix]
+    options = words_arr[start:start + bucket_sizes[prefix]]
     sample_word = rng.choice(options)
     if unique:
       if prefix in exhausted or sample_word in seen:
@@ -93,3 +122,22 @@ def gen_words_with_prefix_freq(num_words, prefix_freq=0.0, seed=None, unique=Fal
       if len(rand_words_list) >= num_words:
         break
   return rand_words_list
+
+
+def _clustered_words(num_words, prefix_freq, np_rng):
+  """Vectorized (non-unique) draw for gen_words_with_prefix_freq.
+  Each cluster is one prefix followed by extra same-prefix words while a
+  uniform draw stays below prefix_freq, i.e. cluster lengths are geometric
+  with success probability (1 - prefix_freq). Clusters are drawn in batches.
+  """
+  chunks = []
+  remaining = num_words
+  while remaining > 0:
+    n_clusters = int(remaining * (1.0 - prefix_freq)) + 1
+    lengths = np_rng.geometric(1.0 - prefix_freq, n_clusters)
+    cluster_prefixes = PREFIX_SAMPLER.draw_indices(n_clusters, np_rng)
+    word_prefixes = np.repeat(cluster_prefixes, lengths)[:remaining]
+    idx = bucket_offsets[word_prefixes] + np_rng.integers(0, bucket_sizes[word_prefixes])
+    chunks.append(words_arr[idx])
+    remaining -= len(idx)
+  return np.concatenate(chunks).tolist()
@@ -1,7 +1,28 @@
-import random
+import ipaddress
 from typing import Dict, Optional, List, Tuple
 from dataclasses import dataclass
-from faker import Faker
+import numpy as np
+from .sampling import WeightedSampler
+
+
+## === Address ranges (as (network_int, num_addresses)) === ##
+
+def _ranges(*cidrs):
+    nets = [ipaddress.ip_network(c) for c in cidrs]
+    return (np.array([int(n.network_address) for n in nets], dtype=np.uint32),
+            np.array([int(n.netmask) for n in nets], dtype=np.uint32),
+            np.array([n.num_addresses for n in nets], dtype=np.int64))
+
+# RFC1918 private ranges, ordered by private class 'a', 'b', 'c'
+PRIVATE_NETS, _, PRIVATE_SIZES = _ranges("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+
+# Ranges that a public address must never fall into (private, shared, loopback,
+# link-local, documentation/benchmarking, multicast and reserved)
+EXCLUDED_NETS, EXCLUDED_MASKS, _ = _ranges(
+    "0.0.0.0/8", "10.0.0.0/8", "100.64.0.0/10", "127.0.0.0/8", "169.254.0.0/16",
+    "172.16.0.0/12", "192.0.0.0/24", "192.0.2.0/24", "192.168.0.0/16", "198.18.0.0/15",
+    "198.51.100.0/24", "203.0.113.0/24", "224.0.0.0/4", "240.0.0.0/4",
+)
 
 ## === Config Class === ##
 
@@ -35,24 +56,41 @@ class IPConfig:
 class IPGenerator:
     def __init__(self, config: IPConfig):
         self.config = config
-        self.rng = random.Random(self.config.seed)
-
-        self.fake = Faker()
-        if self.config.seed is not None:
-            self.fake.seed_instance(self.config.seed)
+        self.rng = np.random.default_rng(self.config.seed)
         self.priv_classes, self.weights = zip(*self.config.private_weights.items())
+        self._class_sampler = WeightedSampler(
+            ["abc".index(cls) for cls in self.priv_classes], self.weights)
+
+    def _private(self, n):
+        """n private addresses; class per address drawn from private_weights."""
+        cls = self._class_sampler.values[self._class_sampler.draw_indices(n, self.rng)].astype(np.int64)
+        # Skip the network and broadcast address of each range
+        offsets = self.rng.integers(1, PRIVATE_SIZES[cls] - 1)
+        return (PRIVATE_NETS[cls] + offsets).astype(np.uint32)
 
-    def _priv_class(self):
-        return self.rng.choices(self.priv_classes, weights=self.weights, k=1)[0]
+    def _public(self, n):
+        """n public addresses; draws landing in an excluded range are redrawn."""
+        out = self.rng.integers(0, 1 << 32, n, dtype=np.uint32)
+        bad = np.flatnonzero(_excluded(out))
+        while bad.size:
+            out[bad] = self.rng.integers(0, 1 << 32, bad.size, dtype=np.uint32)
+            bad = bad[_excluded(out[bad])]
+        return out
 
     def single(self):
-        if self.rng.random() > self.config.public_share:
-            cls = self._priv_class()
-            return self.fake.ipv4_private(address_class=cls)
-        else:
-            return self.fake.ipv4_public()
+        return self.batch(1)[0]
 
     def batch(self, n):
         if n <= 0:
             raise ValueError("n must be positive")
-        return [self.single() for _ in range(n)]
+        is_private = self.rng.random(n) > self.config.public_share
+        addrs = np.empty(n, dtype=np.uint32)
+        n_private = int(is_private.sum())
+        addrs[is_private] = self._private(n_private)
+        addrs[~is_private] = self._public(n - n_private)
+        return [f"{a >> 24}.{(a >> 16) & 255}.{(a >> 8) & 255}.{a & 255}" for a in addrs.tolist()]
+
+
+def _excluded(addrs):
+    """Boolean mask of addresses falling in any EXCLUDED range."""
+    return ((addrs[:, None] & EXCLUDED_MASKS) == EXCLUDED_NETS).any(axis=1)
@@ -0,0 +1,76 @@
+from bisect import bisect_right
+import numpy as np
+
+
+class WeightedSampler:
+  """Weighted sampling from a fixed population using precomputed cumulative weights.
+
+  `random.choices(..., weights=...)` rebuilds the cumulative weights on every call,
+  which is O(n) per draw. This class pays that cost once at construction so each
+  draw is a binary search, O(log n).
+
+  - `draw(rng)` takes a `random.Random` and returns a single value.
+  - `draw_many(num, rng)` takes a `numpy.random.Generator` and returns a list of
+    `num` values drawn in one vectorized `searchsorted` call.
+  """
+  __slots__ = ("values", "cumw", "total", "_cum_list", "_hi")
+
+  def __init__(self, values, weights):
+    if len(values) == 0 or len(values) != len(weights):
+      raise ValueError("values and weights must be non-empty and the same length")
+    self.values = np.empty(len(values), dtype=object)
+    self.values[:] = list(values)
+    self.cumw = np.cumsum(np.asarray(weights, dtype=np.float64))
+    self.total = float(self.cumw[-1])
+    if self.total <= 0:
+      raise ValueError("Total of weights must be greater than zero")
+    self._cum_list = self.cumw.tolist()
+    self._hi = len(values) - 1
+
+  def __len__(self):
+    return len(self.values)
+
+  def draw_index(self, rng):
+    """Draw a single index into `values` using a `random.Random` instance."""
+    return bisect_right(self._cum_list, rng.random() * self.total, 0, self._hi)
+
+  def draw(self, rng):
+    """Draw a single value using a `random.Random` instance."""
+    return self.values[bisect_right(self._cum_list, rng.random() * self.total, 0, self._hi)]
+
+  def draw_indices(self, num, rng):
+    """Draw `num` indices into `values` using a `numpy.random.Generator`."""
+    idx = self.cumw.searchsorted(rng.random(num) * self.total, side="right")
+    return np.minimum(idx, self._hi, out=idx)
+
+  def draw_many(self, num, rng):
+    """Draw `num` values using a `numpy.random.Generator`."""
+    return self.values[self.draw_indices(num, rng)].tolist()
+
+
+class CharStream:
+  """Random characters from a fixed alphabet, generated in bulk and handed out as slices.
+
+  Drawing a few characters at a time costs a Python-level call per character.
+  Instead, `chunk` characters are drawn in one numpy call and decoded to a `str`
+  once; `take` then returns plain string slices. Each refill seeds numpy from the
+  caller's `random.Random`, so output stays reproducible for a seeded rng.
+  """
+  __slots__ = ("alphabet", "chunk", "_buf", "_pos")
+
+  def __init__(self, alphabet, chunk=1 << 16):
+    self.alphabet = np.frombuffer(alphabet.encode("ascii"), dtype=np.uint8)
+    self.chunk = chunk
+    self._buf = ""
+    self._pos = 0
+
+  def take(self, rng, k):
+    """Return k random characters, refilling from `rng` when the buffer runs out."""
+    pos = self._pos
+    if pos + k > len(self._buf):
+      np_rng = np.random.default_rng(rng.getrandbits(64))
+      idx = np_rng.integers(0, len(self.alphabet), max(self.chunk, k))
+      self._buf = self.alphabet[idx].tobytes().decode("ascii")
+      pos = 0
+    self._pos = pos + k
+    return self._buf[pos:pos + k]
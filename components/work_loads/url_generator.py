@@ -1,19 +1,28 @@
 import random
 import math
 import os
-import secrets
 import string
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from bisect import bisect_right
+from itertools import accumulate, chain
+from weakref import WeakKeyDictionary
+import numpy as np
 from tranco import Tranco
-from urllib.parse import urlparse, quote
-
-FILE_DIR = os.path.dirname(os.path.abspath(__file__))
-
-# Load word lists
-with open(os.path.join(FILE_DIR, "words_common.txt"), "r", encoding="utf-8") as f:
-    WORDS_COMMON = [w for w in f.read().splitlines() if w]
-
-with open(os.path.join(FILE_DIR, "words_alpha.txt"), "r", encoding="utf-8") as f:
-    WORDS_BROAD = [w for w in f.read().splitlines() if w]
+from urllib.parse import quote
+from .sampling import WeightedSampler, CharStream
+from .words_data import FILE_DIR, word_list
+
+# Load word lists (shared with en_word_generator, decoded once per process)
+WORDS_COMMON = word_list("words_common.txt")
+WORDS_BROAD = word_list("words_alpha.txt")
+
+# Path segment words, lower-cased and percent-encoded once at import.
+# Pure lower-case ASCII alphanumerics are already URL-safe and are reused as-is.
+WORDS_BROAD_QUOTED = [
+  w if (w.isascii() and w.isalnum() and w.islower()) else quote(w.lower(), safe='-_.~')
+  for w in WORDS_BROAD
+]
   
 domain_cache_path = os.path.join(FILE_DIR, "tranco_cache")
 
@@ -64,13 +73,39 @@ slug_separator_weights = [
 sub_segments = [1, 2, 3, 4, 5, 6, 7, 8]
 sub_segment_weights = [0.30, 0.23, 0.18, 0.12, 0.08, 0.05, 0.03, 0.01]
 
+path_depths = [0, 1, 2, 3, 4, 5]
+path_depth_weights = [0.20, 0.30, 0.25, 0.13, 0.10, 0.02]
+
+
+# --- Samplers built once at import (cumulative weights precomputed) --- #
+SCHEME_SAMPLER = WeightedSampler(["http", "https"], [0.12, 0.88])
+FILE_PATH_SAMPLER = WeightedSampler(file_paths, file_path_weights)
+# Only three separators, drawn once per sub-segment: a bisect over a tuple of
+# cumulative weights is cheaper than a sampler method call.
+SEP = tuple(slug_separators)
+SEP_QUOTED = tuple(quote(sep, safe='-_.~') for sep in slug_separators)
+SEP_CUM = tuple(accumulate(slug_separator_weights))[:-1]
+SUB_SEGMENT_SAMPLER = WeightedSampler(sub_segments, sub_segment_weights)
+PATH_DEPTH_SAMPLER = WeightedSampler(path_depths, path_depth_weights)
+
 
 
 ### ================= URL Generation Functions ================= ###
 
+@lru_cache(maxsize=None)
+def _zipf_weights(n, s):
+  """Zipf weights 1/r**s for ranks 1..n, filled in place in one float64 buffer."""
+  w = np.arange(1, n + 1, dtype=np.float64)
+  np.power(w, -s, out=w)
+  w.flags.writeable = False  # Shared via the cache
+  return w
+
+
 # Pulling list of top domains from Tranco
+@lru_cache(maxsize=None)
 def load_domains(n=100_000, cache_path=domain_cache_path, s=1.1):
-  """Load top n domains from Tranco list, with weights based on Zipf's law."""
+  """Load top n domains from Tranco list, with weights based on Zipf's law.
+    Cached per (n, cache_path, s) so the list parse and weight build happen once."""
   if n <= 0 or n > 1_000_000:
     raise ValueError("n must be between 1 and 1,000,000")
   t = Tranco(cache=True, cache_dir=cache_path)
@@ -78,48 +113,81 @@ def load_domains(n=100_000, cache_path=domain_cache_path, s=1.1):
     latest_list = t.list(subdomains=True)
   except TypeError:
     latest_list = t.list()
-  domains = latest_list.top(n)
-  weights_zipf = [1 / ((r+1) ** s) for r in range(n)]
+  domains = tuple(latest_list.top(n))
+  weights_zipf = tuple(_zipf_weights(n, s).tolist())
   return domains, weights_zipf
 
 
-def sample_host(domains, weights, rng, num_hosts=1):
-  """Choose host domain(s) from a list of domains with given weights."""
-  if num_hosts <= 0 or num_hosts > len(domains):
-    raise ValueError(f"num_hosts must be greater than 0 and less than {len(domains)}")
-  if num_hosts == 1:
-    return rng.choices(domains, weights=weights, k=1)[0]
-  return rng.choices(domains, weights=weights, k=num_hosts)
+@lru_cache(maxsize=None)
+def load_domain_sampler(n=100_000, cache_path=domain_cache_path, s=1.1):
+  """WeightedSampler over the top n Tranco domains (cumulative weights built once)."""
+  domains, _ = load_domains(n, cache_path, s)
+  return WeightedSampler(domains, _zipf_weights(n, s))
 
 
-def pick_scheme(rng):
-  """Pick a scheme (http or https) with a realistic probability."""
-  return rng.choices(["http", "https"], weights=[0.12, 0.88], k=1)[0]
+def sample_host(sampler, np_rng, num_hosts=1):
+  """Choose host domain(s) from a domain sampler.
+    np_rng: numpy Generator; all hosts are drawn in a single vectorized call."""
+  if num_hosts <= 0:
+    raise ValueError("num_hosts must be greater than 0")
+  if num_hosts == 1:
+    return sampler.draw_many(1, np_rng)[0]
+  return sampler.draw_many(num_hosts, np_rng)
 
 
 ## ----- Path Generation Functions ----- ##
 
+# Slug characters come from bulk-filled buffers, one pair per rng so that a
+# seeded rng always produces the same slugs.
+_slug_streams = WeakKeyDictionary()
+
+def _slug_chars(rng, with_digits):
+  streams = _slug_streams.get(rng)
+  if streams is None:
+    streams = _slug_streams[rng] = (
+      CharStream(string.ascii_lowercase),
+      CharStream(string.ascii_lowercase + string.digits),
+    )
+  return streams[with_digits]
+
+
 def slug(rng, min_len=2, max_len=12, digit_p=0.15, sep_p=0.15):
-  pool = string.ascii_lowercase + (string.digits if rng.random() < digit_p else "")
-  s = "".join(rng.choices(pool, k=rng.randint(min_len, max_len)))
-  if rng.random() < sep_p:
-    if len(s) > 3:
-      indx = rng.randint(2, len(s) - 2)
-      seperator = rng.choices(slug_separators, slug_separator_weights, k=1)[0]
-      s = s[:indx] + seperator + s[indx:]
-  return quote(s, safe='-_.~')
+  """Generate a random [a-z0-9] slug, sometimes split by a separator.
+    Slug characters are all URL-unreserved, so only the separator needs quoting."""
+  chars = _slug_chars(rng, rng.random() < digit_p)
+  k = rng.randint(min_len, max_len)
+  if rng.random() < sep_p and k > 3:
+    # Take the two halves straight from the stream rather than slicing a full slug
+    indx = rng.randint(2, k - 2)
+    return chars.take(rng, indx) + SEP_QUOTED[bisect_right(SEP_CUM, rng.random())] + chars.take(rng, k - indx)
+  return chars.take(rng, k)
   
 
-def segment(rng, slug_p):
+def segment(rng, slug_p, num_segs=None):
   """Generate a single path segment."""
-  num_segs = rng.choices(sub_segments, weights=sub_segment_weights, k=1)[0]
+  if num_segs is None:
+    num_segs = SUB_SEGMENT_SAMPLER.draw(rng)
   for i in range(num_segs):
     if rng.random() < slug_p:
       yield slug(rng)
     else:
-      yield quote(rng.choice(WORDS_BROAD).lower(), safe='-_.~')
+      yield rng.choice(WORDS_BROAD_QUOTED)
     if i < num_segs - 1:
-      yield rng.choices(slug_separators, weights=slug_separator_weights, k=1)[0]
+      yield SEP[bisect_right(SEP_CUM, rng.random())]
+
+
+def _fast_path(rng, slug_p):
+  """Depth-1 path, built without the segment list and join of the general case.
+    A lone sub-segment (slug or pre-quoted word) is already URL-safe, so it
+    also skips the segment() generator and quote()."""
+  num_segs = SUB_SEGMENT_SAMPLER.draw(rng)
+  if num_segs == 1:
+    seg = slug(rng) if rng.random() < slug_p else rng.choice(WORDS_BROAD_QUOTED)
+  else:
+    seg = quote("".join(segment(rng, slug_p, num_segs)), safe='-_.~%')
+  if rng.random() < 0.3:
+    return "/" + seg + "." + FILE_PATH_SAMPLER.draw(rng)
+  return "/" + seg + "/"
 
 
 def gen_paths(rng, slug_p=0.3):
@@ -127,16 +195,15 @@ def gen_paths(rng, slug_p=0.3):
     slug_p: probability of a segment being a slug (vs. a common word)."""
   if slug_p < 0 or slug_p > 1:
     raise ValueError("slug_p must be between 0 and 1")
-    
-  num_segs, seg_weights = zip(*[
-    (0, 0.20), (1, 0.30), (2, 0.25), (3, 0.13), (4, 0.10), (5, 0.02)
-  ])
-  depth = rng.choices(num_segs, weights=seg_weights, k=1)[0]
+
+  depth = PATH_DEPTH_SAMPLER.draw(rng)
+  if depth == 0:
+    return "/"
+  if depth == 1:
+    return _fast_path(rng, slug_p)
+
   path = "/"
   segs = []
-  if depth == 0:
-    return path
-    
   for _ in range(depth):
     seg_raw = "".join(segment(rng, slug_p))
     segs.append(quote(seg_raw, safe='-_.~%'))
@@ -144,7 +211,7 @@ def gen_paths(rng, slug_p=0.3):
 
   path += "/".join(segs)
   if rng.random() < 0.3:
-    path += '.' + rng.choices(file_paths, weights=file_path_weights, k=1)[0]
+    path += '.' + FILE_PATH_SAMPLER.draw(rng)
   else:
     path += '/'
   return path
@@ -158,19 +225,35 @@ param_keys = ["q","id","page","ref","utm_source","utm_medium","utm_campaign",
 param_weights = [0.15, 0.13, 0.13, 0.10, 0.06, 0.06, 0.05, 0.03, 
      0.03, 0.06, 0.10, 0.05, 0.05]
 
+num_params_opts = [0, 1, 2, 3, 4, 5, 6, 7]
+num_params_weights = [0.40, 0.35, 0.11, 0.09, 0.03, 0.015, 0.005, 0.002]
+NUM_PARAMS_SAMPLER = WeightedSampler(num_params_opts, num_params_weights)
+
+q_num_words = [1, 2, 3, 4, 5, 6, 8, 12]
+q_num_words_weights = [0.25, 0.25, 0.2, 0.12, 0.08, 0.05, 0.03, 0.02]
+Q_WORDS_SAMPLER = WeightedSampler(q_num_words, q_num_words_weights)
+
+# Bit i of a seen-mask marks param_keys[i] as already used in the query string
+PARAM_BITS = {k: 1 << i for i, k in enumerate(param_keys)}
+
+
+@lru_cache(maxsize=None)
+def _param_sampler(seen_mask):
+  """Sampler over the param keys not in seen_mask (built once per mask on first use)."""
+  new_keys, new_weights = zip(*[
+    (k, w) for i, (k, w) in enumerate(zip(param_keys, param_weights)) if not seen_mask >> i & 1
+  ])
+  return WeightedSampler(new_keys, new_weights)
 
 
-def param_pair(rng, seen):
-  """Generate a single key-value pair for a query string."""
-  kw = zip(param_keys, param_weights)
-  new_keys, new_weights = zip(*[duo for duo in kw if duo[0] not in seen])
-  key = rng.choices(new_keys, weights=new_weights, k=1)[0]
-  seen.add(key)
+def param_pair(rng, seen_mask):
+  """Generate a single key-value pair for a query string.
+    Returns (pair, seen_mask) with the chosen key's bit added to the mask."""
+  key = _param_sampler(seen_mask).draw(rng)
+  seen_mask |= PARAM_BITS[key]
   
   if key == 'q':  # slugified words joined with + or percent-encoded spaces, can be very long
-    nw = [1,2,3,4,5,6,8,12]
-    nw_weights = [0.25,0.25,0.2,0.12,0.08,0.05,0.03,0.02]
-    num_words = rng.choices(nw, weights=nw_weights, k=1)[0]
+    num_words = Q_WORDS_SAMPLER.draw(rng)
     search_words = rng.choices(WORDS_COMMON, k=num_words)
     space_sym = '+'
     if rng.random() < 0.2:
@@ -183,7 +266,7 @@ def param_pair(rng, seen):
   elif key in ['fbclid', 'ref', 'token', 'session']: # long random hex or base64-like tokens (
     if rng.random() < 0.6:
       bytes_len = rng.choice([8,12,16,24,32])
-      val = secrets.token_hex(bytes_len)
+      val = rng.randbytes(bytes_len).hex()  # Seeded and syscall-free; not for crypto
     else:
       val = slug(rng, min_len=16, max_len=48, digit_p=0.33, sep_p=0.0)
 
@@ -200,20 +283,19 @@ def param_pair(rng, seen):
     if rng.random() < 0.2:
       space_sym = "%20"
     val = space_sym.join(search_words)
-  return key + '=' + val
+  return key + '=' + val, seen_mask
   
 
 def query_string(rng):
   """Generate a random query string (or none) with a random number of parameters."""
-  np = [0, 1, 2, 3, 4, 5, 6, 7]
-  np_weights = [0.40, 0.35, 0.11, 0.09, 0.03, 0.015, 0.005, 0.002]
-  num_params = rng.choices(np, weights=np_weights, k=1)[0]
+  num_params = NUM_PARAMS_SAMPLER.draw(rng)
   if num_params == 0:
     return ''
   pairs = []
-  seen = set()
+  seen_mask = 0
   for _ in range(num_params):
-    pairs.append(param_pair(rng, seen))
+    pair, seen_mask = param_pair(rng, seen_mask)
+    pairs.append(pair)
   pairs.sort()
   return '?' + '&'.join(pairs)
 
@@ -221,19 +303,37 @@ def query_string(rng):
 
 ### ================= Final URL Generation Logic ================= ###
 
-def generate_urls(num_urls, seed=None):
-  """Generate a list of random URLs."""
+# Below this many URLs, process start-up costs more than it saves
+PARALLEL_MIN_URLS = 20_000
+
+def generate_urls(num_urls, seed=None, n_jobs=1):
+  """Generate a list of random URLs.
+    n_jobs: worker processes to split large batches across (None = all cores).
+      Chunk i is generated with seed + i, so seeded output depends on n_jobs."""
+  if num_urls <= 0:
+    return []
+  if n_jobs is None:
+    n_jobs = os.cpu_count() or 1
+  if n_jobs > 1 and num_urls >= PARALLEL_MIN_URLS:
+    sizes = [num_urls // n_jobs + (i < num_urls % n_jobs) for i in range(n_jobs)]
+    seeds = [None if seed is None else seed + i for i in range(n_jobs)]
+    with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+      return list(chain.from_iterable(ex.map(generate_urls, sizes, seeds)))
   rng = random.Random(seed)
-  domains, weights = load_domains()
-  urls = []
-  for _ in range(num_urls):
-    scheme = pick_scheme(rng)
-    host = sample_host(domains, weights, rng)
-    path = gen_paths(rng)
-    query = query_string(rng)
-    url = f"{scheme}://{host}{path}{query}"
-    urls.append(url)
-  return urls
+  np_rng = np.random.default_rng(seed)
+  host_sampler = load_domain_sampler()
+
+  # Each component is an object array; `+` concatenates element-wise in one C loop
+  schemes = SCHEME_SAMPLER.values[SCHEME_SAMPLER.draw_indices(num_urls, np_rng)]
+  hosts = host_sampler.values[host_sampler.draw_indices(num_urls, np_rng)]
+  paths = np.empty(num_urls, dtype=object)
+  queries = np.empty(num_urls, dtype=object)
+  for i in range(num_urls):
+    paths[i] = gen_paths(rng)
+    queries[i] = query_string(rng)
+
+  urls = schemes + "://" + hosts + paths + queries
+  return urls.tolist()
 
 
 
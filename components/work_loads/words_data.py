@@ -0,0 +1,66 @@
+import mmap
+import os
+from functools import lru_cache
+import numpy as np
+
+FILE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+class WordList:
+  """Read-only word list backed by a memory-mapped text file and an offset index.
+
+  The file is mapped once and never copied into per-word objects; `starts`/`ends`
+  hold the byte span of each non-empty line (CRLF endings are trimmed). Word `i`
+  is decoded only when requested, so index-based sampling can stay on integers
+  until the words are materialized with `take`. The mapping is shared by the OS
+  page cache across worker processes.
+  """
+  __slots__ = ("path", "blob", "starts", "ends")
+
+  def __init__(self, path):
+    self.path = path
+    with open(path, "rb") as f:
+      if os.fstat(f.fileno()).st_size:
+        self.blob = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+      else:
+        self.blob = b""
+    buf = np.frombuffer(self.blob, dtype=np.uint8)
+    nl = np.flatnonzero(buf == 10)
+    starts = np.concatenate(([0], nl + 1))
+    ends = np.concatenate((nl, [len(buf)]))
+    # Trim the '\r' of CRLF line endings, then drop blank lines
+    has_cr = ends > starts
+    has_cr[has_cr] = buf[ends[has_cr] - 1] == 13
+    ends -= has_cr
+    keep = ends > starts
+    self.starts = starts[keep]
+    self.ends = ends[keep]
+
+  def __len__(self):
+    return len(self.starts)
+
+  def __getitem__(self, i):
+    return self.blob[self.starts[i]:self.ends[i]].decode("utf-8")
+
+  def take(self, indices):
+    """Decode the words at `indices` into a list of str."""
+    blob, starts, ends = self.blob, self.starts, self.ends
+    return [blob[s:e].decode("utf-8") for s, e in zip(starts[indices].tolist(), ends[indices].tolist())]
+
+  def tolist(self):
+    """Decode every word, in file order, split exactly as `starts`/`ends` are."""
+    lines = self.blob[:].decode("utf-8").split("\n")
+    lines = (w[:-1] if w[-1:] == "\r" else w for w in lines)
+    return [w for w in lines if w]
+
+
+@lru_cache(maxsize=None)
+def load_words(name):
+  """Return the `WordList` for `name` in this package, mapped once per process."""
+  return WordList(os.path.join(FILE_DIR, name))
+
+
+@lru_cache(maxsize=None)
+def word_list(name):
+  """Return the words of `name` as a list of str, decoded once per process and shared by callers."""
+  return load_words(name).tolist()
@@ -434,6 +434,116 @@ def test_structural_invariants():
     walk(t.root)
 
 
+def read_only_word_sets() -> list[tuple[str, list[str]]]:
+    return [
+        ("empty", []),
+        ("single key", ["solo"]),
+        ("prefix of another", ["app", "apple", "applesauce"]),
+        ("empty string + words", ["", "a", "ab"]),
+        ("fixed", gen_words_fixed()),
+        ("random", gen_random_words(300, alphabet="abc", min_len=1, max_len=8)),
+    ]
+
+def read_only_probes(words: list[str]) -> list[str]:
+    probes = list(words) + ["", "a", "ap", "appl", "applesauces", "zzz", "solos", "so"]
+    probes += [w[:-1] for w in words if w] + [w + "x" for w in words[:50]]
+    return probes
+
+def test_freeze_matches_search():
+    section("TEST: freeze() vs plain search")
+    for name, words in read_only_word_sets():
+        t = CompressedTrie()
+        t.batch_insert(words)
+        probes = read_only_probes(words)
+        plain = [t.search(w) for w in probes]
+        t.freeze()
+        frozen = [t.search(w) for w in probes]
+        check(f"freeze search == plain search ({name})", frozen == plain,
+              f"First mismatch: {next((w for w, a, b in zip(probes, plain, frozen) if a is not b), None)!r}")
+
+    t = CompressedTrie()
+    t.batch_insert(["Apple", "apply"])
+    t.freeze(max_nesting=1)
+    check("freeze max_nesting=1 hit", t.search("APPLE") is not None)
+    check("freeze max_nesting=1 miss", t.search("appl") is None)
+
+    # Any mutation drops the frozen search
+    t.single_insert("applet")
+    check("insert invalidates _frozen", t._frozen is None)
+    check("search after insert sees new word", t.search("applet") is not None)
+    t.freeze()
+    t.batch_delete(["apply"])
+    check("batch_delete invalidates _frozen", t._frozen is None)
+    check("search after delete misses word", t.search("apply") is None)
+    t.freeze()
+    t.single_delete("apple")
+    check("single_delete invalidates _frozen", t._frozen is None)
+    check("search after single_delete", t.search("apple") is None and t.search("applet") is not None)
+
+
+def test_path_decomposed_matches_search():
+    section("TEST: to_path_decomposed() / search_frozen vs search")
+    for name, words in read_only_word_sets():
+        t = CompressedTrie()
+        t.batch_insert(words)
+        probes = read_only_probes(words)
+        exp = [t.search(w) is not None for w in probes]
+        got = [t.search_frozen(w) for w in probes]
+        check(f"search_frozen == search ({name})", got == exp,
+              f"First mismatch: {next((w for w, a, b in zip(probes, exp, got) if a != b), None)!r}")
+        paths, _, _ = t.to_path_decomposed()
+        check(f"path 0 starts at root ({name})", len(paths) >= 1 and isinstance(paths[0], str))
+
+    t = CompressedTrie()
+    t.batch_insert(["team", "tea", "ten"])
+    t.to_path_decomposed()
+    check("search_frozen normalizes by default", t.search_frozen("TEA") is True)
+    check("search_frozen normalize=None", t.search_frozen("TEA", normalize=None) is False)
+
+    # Mutations drop the cached layout; the next call rebuilds it
+    t.single_insert("tent")
+    check("insert invalidates _paths", t._paths is None)
+    check("search_frozen after insert", t.search_frozen("tent") is True)
+    t.batch_delete(["tea"])
+    check("batch_delete invalidates _paths", t._paths is None)
+    check("search_frozen after delete", t.search_frozen("tea") is False and t.search_frozen("team") is True)
+
+
+def export_sorted(t) -> list[str]:
+    return sorted(t.enumerate_prefix("", k=None))
+
+def test_from_sorted_matches_batch_insert():
+    section("TEST: from_sorted() vs batch_insert")
+    for name, words in read_only_word_sets() + [("dups + mixed case", gen_words_with_dups_unsorted())]:
+        ref = CompressedTrie()
+        ref.batch_insert(words)
+        bulk = CompressedTrie.from_sorted(sorted(w.casefold() for w in words))
+        check(f"from_sorted export == batch_insert ({name})", export_sorted(bulk) == export_sorted(ref))
+        check(f"from_sorted count_nodes == batch_insert ({name})",
+              bulk.count_nodes() == ref.count_nodes(), f"Got {bulk.count_nodes()} vs {ref.count_nodes()}")
+        probes = read_only_probes([w.casefold() for w in words])
+        check(f"from_sorted search == batch_insert ({name})",
+              all((bulk.search(w) is None) == (ref.search(w) is None) for w in probes))
+
+    # Sorted under the default casefold, not as given
+    bulk = CompressedTrie.from_sorted(["Apple", "apply", "BAT"])
+    check("from_sorted normalizes input", export_sorted(bulk) == ["apple", "apply", "bat"],
+          f"Got {export_sorted(bulk)}")
+    expect_exception("from_sorted rejects unsorted input",
+                     lambda: CompressedTrie.from_sorted(["b", "a"]), ValueError)
+    expect_exception("from_sorted normalize=None checks raw order",
+                     lambda: CompressedTrie.from_sorted(["a", "B"], normalize=None), ValueError)
+    raw = CompressedTrie.from_sorted(["B", "a"], normalize=None)
+    check("from_sorted normalize=None keeps words as given", export_sorted(raw) == ["B", "a"],
+          f"Got {export_sorted(raw)}")
+
+    # A bulk-loaded trie stays mutable
+    bulk.single_insert("app")
+    bulk.single_delete("apply")
+    check("from_sorted trie accepts later mutations", export_sorted(bulk) == ["app", "apple", "bat"],
+          f"Got {export_sorted(bulk)}")
+
+
 # ------------------------------------------------------------------------------
 # Main
 # ------------------------------------------------------------------------------
@@ -466,6 +576,11 @@ if __name__ == "__main__":
     test_fuzz_enumeration_prefix_property()
     test_structural_invariants()
 
+    # Read-only layouts and bulk load
+    test_freeze_matches_search()
+    test_path_decomposed_matches_search()
+    test_from_sorted_matches_batch_insert()
+
     print("\n" + "-" * 70)
     print(f"RESULTS: PASS={PASS}  FAIL={FAIL}  SKIP={SKIP}")
     print("-" * 70)
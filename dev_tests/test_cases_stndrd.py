@@ -18,6 +18,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # ------------------------------------------------------------------------------
 try:
     from tries.compressed_trie import CompressedTrie  # adjust if your file/module name differs
+    from tries.standard_trie import Trie
 except Exception as e:
     print("[FAIL] Could not import Trie from compressed_trie.py")
     print("       Import error:", repr(e))
@@ -254,6 +255,107 @@ def test_large_random_roundtrip():
     survivors_ok = all(t.search(w) is not None for w in random.sample(survivors, 25))
     check("survivors still present", survivors_ok)
 
+def test_list_prefix_matches_enumerate():
+    section("TEST: Trie.list_prefix vs enumerate_prefix")
+    t = Trie()
+    words = gen_words_fixed() + gen_random_words(300, alphabet="abc", min_len=1, max_len=6) + [""]
+    t.batch_insert(words)
+    for prefix in ["", "a", "ap", "app", "ba", "abc", "zz"]:
+        for k in [None, 0, 1, 2, 5, 1000]:
+            got = t.list_prefix(prefix, k)
+            exp = list(t.enumerate_prefix(prefix, k))
+            check(f"list_prefix == enumerate_prefix ({prefix!r}, k={k})", got == exp,
+                  f"Got {got[:5]}... vs {exp[:5]}...")
+
+def test_compile_search_matches_search():
+    section("TEST: Trie.compile_search vs search")
+    t = Trie()
+    words = gen_words_fixed() + gen_random_words(300, alphabet="abc", min_len=1, max_len=8)
+    t.batch_insert(words)
+    match = t.compile_search()
+    hits = [w.casefold() for w in words] + ["APPLE", "Dove"]
+    misses = ["", "zzz", "applyy", "apps", "catering"]
+    prefixes = ["ap", "ba", "ca", "d"]   # paths in the trie that are not words
+    for w in hits + misses + prefixes:
+        check(f"compile_search == search: {w!r}", match(w) == (t.search(w) is not None),
+              f"compiled={match(w)} search={t.search(w) is not None}")
+    check("compile_search on empty trie", Trie().compile_search()("") is False)
+
+    # normalize=None compares the query as given
+    raw = t.compile_search(normalize=None)
+    check("compile_search normalize=None hit", raw("apple") is True)
+    check("compile_search normalize=None skips casefold", raw("APPLE") is False)
+    for w in hits + misses + prefixes:
+        check(f"compile_search normalize=None == search: {w!r}",
+              raw(w) == (t.search(w, normalize=None) is not None))
+
+    # Words deeper than max_nesting are split across generated functions
+    deep = Trie()
+    long_words = ["ab" * 20, "ab" * 20 + "c", "ab" * 10 + "x", "abab", "a"]
+    deep.batch_insert(long_words)
+    shallow = deep.compile_search(max_nesting=2)
+    probes = long_words + ["ab" * 15, "ab" * 20 + "cc", "ab" * 10, "ab"]
+    for w in probes:
+        check(f"compile_search max_nesting=2: len {len(w)} {w[-3:]!r}",
+              shallow(w) == (deep.search(w) is not None))
+
+def test_normalize_none_uses_words_as_is():
+    section("TEST: Trie normalize=None (no re-normalization)")
+    t = Trie()
+    out = t._prepare_batch(["b", "B", "a", "b"], normalize=None, dedup=True, presorted=False)
+    check("_prepare_batch normalize=None keeps case", out == ["B", "a", "b"], f"Got: {out}")
+
+    t.batch_insert(["Apple", "apple", "Bat"], normalize=None)
+    t.single_insert("Dog", normalize=None)
+    check("normalize=None insert keeps 'Apple'", t.search("Apple", normalize=None) is not None)
+    check("normalize=None insert keeps 'apple'", t.search("apple", normalize=None) is not None)
+    check("normalize=None insert keeps 'Dog'", t.search("Dog", normalize=None) is not None)
+    check("normalize=None search does not fold 'BAT'", t.search("BAT", normalize=None) is None)
+    check("default search folds to missing 'bat'", t.search("Bat") is None)
+    check("normalize=None enumerate", sorted(t.enumerate_prefix("", normalize=None)) == ["Apple", "Bat", "Dog", "apple"],
+          f"Got: {sorted(t.enumerate_prefix('', normalize=None))}")
+    check("normalize=None list_prefix", t.list_prefix("A", normalize=None) == ["Apple"],
+          f"Got: {t.list_prefix('A', normalize=None)}")
+    check("normalize=None prefix_search", t.prefix_search("Ap", normalize=None) is not None)
+
+    deleted, missing = t.batch_delete(["Apple", "APPLE"], normalize=None)
+    check("normalize=None batch_delete counts", (deleted, missing) == (1, 1), f"Got {(deleted, missing)}")
+    check("normalize=None single_delete", t.single_delete("Dog", normalize=None) is True)
+    check("normalize=None leaves 'apple'", t.search("apple", normalize=None) is not None)
+
+def count_by_traversal(t) -> int:
+    total = 0
+    stack = [t.root]
+    while stack:
+        node = stack.pop()
+        total += 1
+        if node.children:
+            stack.extend(node.children.values())
+    return total
+
+def test_count_nodes_tracks_mixed_ops():
+    section("TEST: Trie.count_nodes vs traversal after mixed ops")
+    t = Trie()
+    check("count_nodes empty trie", t.count_nodes() == count_by_traversal(t) == 1)
+    pool = gen_random_words(400, alphabet="abcd", min_len=1, max_len=7) + gen_words_fixed()
+    for step in range(30):
+        op = step % 3
+        batch = random.sample(pool, 40)
+        if op == 0:
+            t.batch_insert(batch)
+        elif op == 1:
+            t.batch_delete(batch)
+        else:
+            for w in batch[:10]:
+                t.single_insert(w)
+            for w in batch[10:]:
+                t.single_delete(w)
+        got, exp = t.count_nodes(), count_by_traversal(t)
+        check(f"count_nodes == traversal after step {step}", got == exp, f"Got {got} vs {exp}")
+    t.batch_delete(pool)
+    check("count_nodes back to root only", t.count_nodes() == count_by_traversal(t) == 1,
+          f"Got {t.count_nodes()}")
+
 # ------------------------------------------------------------------------------
 # Main
 # ------------------------------------------------------------------------------
@@ -272,6 +374,10 @@ if __name__ == "__main__":
     test_unicode_normalization()
     test_count_nodes_and_avg_branch_factor()
     test_large_random_roundtrip()
+    test_list_prefix_matches_enumerate()
+    test_compile_search_matches_search()
+    test_normalize_none_uses_words_as_is()
+    test_count_nodes_tracks_mixed_ops()
 
     print("\n" + "-" * 70)
     print(f"RESULTS: PASS={PASS}  FAIL={FAIL}  SKIP={SKIP}")
@@ -23,13 +23,15 @@ import re
 import time
 import math
 import json
-import random
-import statistics as stats
 from typing import List, Dict, Tuple, Optional
 from collections import Counter
-from urllib.parse import urlparse, unquote
+from concurrent.futures import ProcessPoolExecutor
+from itertools import cycle, islice
+from urllib.parse import urlparse, uses_params
 import ipaddress
 
+import numpy as np
+
 # ================================
 # CONFIG
 # ================================
@@ -72,9 +74,24 @@ def fmt_pct(x, total): return "0.00%" if total == 0 else f"{(100.0 * x / total):
 # ================================
 # URL validation
 # ================================
-LABEL_RE = re.compile(r"^[a-z0-9-]{1,63}$", re.IGNORECASE)
-TLD_RE = re.compile(r"^[a-z]{2,63}$", re.IGNORECASE)
-PATH_SEG_RE = re.compile(r"^[A-Za-z0-9._~!$&'()*+,;=:@%-]*$")
+# Whole-host check in one match: <= 253 chars, dot-separated 1-63 char labels
+# that don't start/end with '-', and an alphabetic 2-63 char TLD.
+HOSTNAME_RE = re.compile(
+    r"^(?=.{1,253}\Z)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)*[a-z]{2,63}\Z", re.IGNORECASE
+)
+# Whole path as '/'-separated RFC 3986 pchar segments: '%' only as the start of a %XX escape
+PATH_RE = re.compile(r"^(?:[A-Za-z0-9._~!$&'()*+,;=:@/-]|%[0-9A-Fa-f]{2})*\Z")
+# The same character set (minus '%') as bytes: translate() deleting these leaves only the bad chars
+PATH_CHARS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._~!$&'()*+,;=:@/-"
+
+def is_valid_path(path: str) -> bool:
+    """Charset check via a C-level byte delete; only paths with '%' escapes need PATH_RE."""
+    if not path.isascii():
+        return False
+    rest = path.encode("ascii").translate(None, PATH_CHARS)
+    return not rest or (b"%" in rest and PATH_RE.match(path) is not None)
+
+HTTP_SCHEMES = frozenset({"http", "https"})
 
 COMMON_TLDS = {
     "com","org","net","io","edu","gov","co","us","uk","de","jp","fr","au","ca","nl","it","es"
@@ -82,16 +99,9 @@ COMMON_TLDS = {
 
 def is_valid_hostname(host: str) -> bool:
     """DNS host only (not IP literal) — URL generator should primarily produce hostnames."""
-    if not host or len(host) > 253:
+    if not host:
         return False
-    labels = host.split(".")
-    for label in labels:
-        if not label or label.startswith("-") or label.endswith("-"):
-            return False
-        if not LABEL_RE.match(label):
-            return False
-    tld = labels[-1]
-    return bool(TLD_RE.match(tld))
+    return HOSTNAME_RE.match(host) is not None
 
 def _parse_url_lenient(u: str):
     """If scheme-less, prefix '//' to allow urlparse to fill hostname."""
@@ -100,7 +110,89 @@ def _parse_url_lenient(u: str):
         pu = urlparse(f"//{u}", scheme=URL_DEFAULT_SCHEME)
     return pu
 
-def analyze_urls(urls: List[str]) -> Dict[str, any]:
+# One match splits scheme / netloc / path / query / fragment the way urlparse does.
+# Tabs and newlines (which urlparse strips) and a leading control char/space fail
+# the match, as do IPv6 brackets; those URLs go through _parse_url_lenient instead.
+URL_SPLIT_RE = re.compile(
+    r"^(?![\x00-\x20])(?:([a-zA-Z][a-zA-Z0-9+\-.]*):)?+(?://([^/?#\t\r\n\[\]]*)(?=[/?#]|$)|(?!//))"
+    r"([^?#\t\r\n]*)(?:\?([^#\t\r\n]*))?(?:#([^\t\r\n]*))?$"
+)
+USES_PARAMS = frozenset(uses_params)
+
+def _strip_params(path: str) -> str:
+    """Drop ;params from the last path segment, as urlparse does."""
+    cut = path.find(";", path.rfind("/")) if "/" in path else path.find(";")
+    return path if cut < 0 else path[:cut]
+
+def _split_url(u: str) -> Tuple[str, str, str, str, str]:
+    """(scheme, host, path, query, fragment) with the same values as _parse_url_lenient."""
+    m = URL_SPLIT_RE.match(u) if u.isascii() else None
+    if m is not None:
+        scheme, netloc, raw_path, query, fragment = m.groups()
+        # Lower-case only when needed: generated schemes and hosts already are
+        if not scheme:
+            scheme = ""
+        elif not scheme.islower():
+            scheme = scheme.lower()
+        path = _strip_params(raw_path) if ";" in raw_path and scheme in USES_PARAMS else raw_path
+        if not netloc and not scheme and path and not STRICT_SCHEME:
+            # Scheme-less: reparse as "//" + u, so the host runs up to the first '/'
+            head = u[:m.end(3)]
+            cut = head.find("/")
+            netloc, path = (head, "") if cut < 0 else (head[:cut], head[cut:])
+            scheme = URL_DEFAULT_SCHEME
+            if ";" in path:
+                path = _strip_params(path)
+        if netloc is None or "[" not in netloc and "]" not in netloc:
+            host = netloc or ""
+            if "@" in host:
+                host = host.rpartition("@")[2]
+            if ":" in host:
+                host = host.partition(":")[0]
+            if not host.islower():
+                host = host.lower()
+            return scheme, host, path, query or "", fragment or ""
+    pu = _parse_url_lenient(u)
+    # urlparse already lower-cases the scheme and host (apart from an IPv6 zone id)
+    return pu.scheme, (pu.hostname or "").lower(), pu.path, pu.query, pu.fragment
+
+# ================================
+# Parallel analysis
+# ================================
+PARALLEL_MIN_ROWS = 50_000  # below this, process start-up costs more than it saves
+
+def _parallel_chunks(fn, rows: list, n_jobs: Optional[int]) -> List[Dict[str, any]]:
+    """Run a chunk analyzer over `rows`, split across processes when the input is large."""
+    n_jobs = n_jobs or os.cpu_count() or 1
+    if n_jobs <= 1 or len(rows) < PARALLEL_MIN_ROWS:
+        return [fn(rows)]
+    size = math.ceil(len(rows) / n_jobs)
+    with ProcessPoolExecutor(max_workers=n_jobs) as ex:
+        return list(ex.map(fn, [rows[i:i + size] for i in range(0, len(rows), size)]))
+
+def _merge_results(parts: List[Dict[str, any]]) -> Dict[str, any]:
+    """Sum per-chunk results in input order: ints add, Counters update, examples keep the first 5."""
+    res = parts[0]
+    for part in parts[1:]:
+        for key, val in part.items():
+            if isinstance(val, Counter):
+                res[key].update(val)
+            elif isinstance(val, list):
+                res[key].extend(val)
+            else:
+                res[key] += val
+    res["examples_invalid"] = res["examples_invalid"][:5]
+    return res
+
+def analyze_urls(urls: List[str], n_jobs: Optional[int] = None) -> Dict[str, any]:
+    """n_jobs: worker processes for large inputs (default: all CPUs)."""
+    res = _merge_results(_parallel_chunks(_analyze_url_chunk, urls, n_jobs))
+    depth_sum, depth_count = res.pop("_depth_sum"), res.pop("_depth_count")
+    if depth_count:
+        res["avg_path_depth"] = depth_sum / depth_count
+    return res
+
+def _analyze_url_chunk(urls: List[str]) -> Dict[str, any]:
     res = {
         "total": len(urls),
         "valid": 0,
@@ -111,45 +203,60 @@ def analyze_urls(urls: List[str]) -> Dict[str, any]:
         "with_query": 0,
         "with_fragment": 0,
         "avg_path_depth": 0.0,
-        "path_depths": [],
         "examples_invalid": [],
     }
 
+    # Hot-loop names bound once instead of looked up per URL / segment
+    split_url = _split_url
+    is_host = is_valid_hostname
+    # Generated hosts repeat heavily (Zipf): validate each once per call and keep its
+    # TLD (interned, or None when not counted) so repeats reuse the same string object
+    host_cache = {}
+    intern = sys.intern
+    valid_path = is_valid_path
+    depth_sum = depth_count = 0
+    # Per-URL values are collected and counted once at the end
+    schemes, tlds = [], []
+    add_scheme, add_tld = schemes.append, tlds.append
+    n_www = n_query = n_fragment = 0
+
     for u in urls:
         try:
-            pu = _parse_url_lenient(u)
+            scheme, host, path, query, fragment = split_url(u)
         except Exception:
             res["invalid"] += 1
             if len(res["examples_invalid"]) < 5:
                 res["examples_invalid"].append(u)
             continue
 
-        scheme = pu.scheme.lower()
-        host = (pu.hostname or "").lower()
-        path = pu.path or ""
-        query = pu.query or ""
-        fragment = pu.fragment or ""
-
         # Scheme rule
         if STRICT_SCHEME:
-            scheme_ok = scheme in {"http", "https"}
+            scheme_ok = scheme in HTTP_SCHEMES
         else:
-            scheme_ok = (scheme in {"http", "https"}) or (scheme == "" and host)
+            scheme_ok = (scheme in HTTP_SCHEMES) or (scheme == "" and host)
 
         # Hostname rule (DNS only; not accepting IP literals for URL host realism)
-        host_ok = is_valid_hostname(host) if host else False
-
-        # Path charset
+        cached = host_cache.get(host)
+        if cached is None:
+            tld = None
+            if "." in host:
+                tld = host.rpartition(".")[2]
+                # Skip dotted all-digit hosts (IP literals); a TLD with a non-digit rules
+                # that out without rebuilding the host string
+                if (tld and not tld.isdigit()) or not host.replace(".", "").isdigit():
+                    tld = intern(tld)
+                else:
+                    tld = None
+            cached = host_cache[host] = (is_host(host) if host else False, tld)
+        host_ok, tld = cached
+
+        # Path charset (one match over the whole path) and depth (non-empty segments)
         path_ok = True
         if path:
-            segs = [s for s in path.split("/") if s]
-            for seg in segs:
-                if not PATH_SEG_RE.match(unquote(seg)):
-                    path_ok = False
-                    break
-            res["path_depths"].append(len(segs))
-        else:
-            res["path_depths"].append(0)
+            path_ok = valid_path(path)
+            segs = path.split("/")
+            depth_sum += len(segs) - segs.count("")
+        depth_count += 1
 
         if scheme_ok and host_ok and path_ok:
             res["valid"] += 1
@@ -158,19 +265,23 @@ def analyze_urls(urls: List[str]) -> Dict[str, any]:
             if len(res["examples_invalid"]) < 5:
                 res["examples_invalid"].append(u)
 
-        res["schemes"][scheme] += 1
-        if host and "." in host and not host.replace(".", "").isdigit():
-            tld = host.split(".")[-1]
-            res["tlds"][tld] += 1
+        add_scheme(intern(scheme))
+        if tld is not None:
+            add_tld(tld)
         if host.startswith("www."):
-            res["hosts_with_www"] += 1
+            n_www += 1
         if query:
-            res["with_query"] += 1
+            n_query += 1
         if fragment:
-            res["with_fragment"] += 1
-
-    if res["path_depths"]:
-        res["avg_path_depth"] = stats.mean(res["path_depths"])
+            n_fragment += 1
+
+    res["schemes"] = Counter(schemes)
+    res["tlds"] = Counter(tlds)
+    res["hosts_with_www"] = n_www
+    res["with_query"] = n_query
+    res["with_fragment"] = n_fragment
+    res["_depth_sum"] = depth_sum
+    res["_depth_count"] = depth_count
     return res
 
 def print_url_report(analysis: Dict[str, any]):
@@ -239,13 +350,57 @@ UNROUTABLE_RANGES = [
     ipaddress.ip_network("255.255.255.255/32"),
 ]
 
-def is_private_ipv4(ip: ipaddress.IPv4Address) -> bool:
-    return any(ip in n for n in RFC1918_RANGES)
-
-def is_unroutable_or_reserved(ip: ipaddress.IPv4Address) -> bool:
-    return any(ip in n for n in UNROUTABLE_RANGES)
-
-def analyze_ips(ips: List[str]) -> Dict[str, any]:
+# (network_int, netmask_int) per range, so membership is (ip & mask) == net
+RFC1918_NET_MASKS = [(int(n.network_address), int(n.netmask)) for n in RFC1918_RANGES]
+UNROUTABLE_NET_MASKS = [(int(n.network_address), int(n.netmask)) for n in UNROUTABLE_RANGES]
+
+def is_private_ipv4(ip) -> bool:
+    """ip: IPv4Address or its int value."""
+    ip_int = int(ip)
+    return any((ip_int & m) == n for n, m in RFC1918_NET_MASKS)
+
+def is_unroutable_or_reserved(ip) -> bool:
+    """ip: IPv4Address or its int value."""
+    ip_int = int(ip)
+    return any((ip_int & m) == n for n, m in UNROUTABLE_NET_MASKS)
+
+# Dotted-quad exactly as ipaddress.IPv4Address accepts it: ASCII digits, no leading zeros, 0-255
+IPV4_RE = re.compile(r"(?:(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])\.){3}(?:25[0-5]|2[0-4][0-9]|1[0-9][0-9]|[1-9]?[0-9])")
+
+def _range_masks(net_masks) -> Tuple[np.ndarray, np.ndarray]:
+    """(network, netmask) uint32 arrays from (network_int, netmask_int) pairs."""
+    nets = np.array([n for n, _ in net_masks], dtype=np.uint32)
+    masks = np.array([m for _, m in net_masks], dtype=np.uint32)
+    return nets, masks
+
+RFC1918_NETS, RFC1918_MASKS = _range_masks(RFC1918_NET_MASKS)
+UNROUTABLE_NETS, UNROUTABLE_MASKS = _range_masks(UNROUTABLE_NET_MASKS)
+
+def _ipv4_to_u32(valid: List[str]) -> np.ndarray:
+    """Parse already-validated dotted quads into uint32 with array ops over one byte buffer.
+    Every octet ends at a '.', so its value is read from the 1-3 digits before it."""
+    buf = np.frombuffer((".".join(valid) + ".").encode("ascii"), dtype=np.uint8)
+    ends = np.flatnonzero(buf == ord("."))
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    lens = ends - starts
+    digits = buf.astype(np.uint32) - ord("0")
+    octets = digits[ends - 1]
+    octets += np.where(lens >= 2, digits[ends - 2] * 10, 0).astype(np.uint32)
+    octets += np.where(lens == 3, digits[ends - 3] * 100, 0).astype(np.uint32)
+    octets = octets.reshape(-1, 4)
+    return (octets[:, 0] << 24) | (octets[:, 1] << 16) | (octets[:, 2] << 8) | octets[:, 3]
+
+def _in_ranges(u32: np.ndarray, nets: np.ndarray, masks: np.ndarray) -> np.ndarray:
+    """Boolean [len(u32), len(nets)] membership table: (ip & mask) == net."""
+    return (u32[:, None] & masks) == nets
+
+def analyze_ips(ips: List[str], n_jobs: Optional[int] = None) -> Dict[str, any]:
+    """n_jobs: worker processes for large inputs (default: all CPUs)."""
+    return _merge_results(_parallel_chunks(_analyze_ip_chunk, ips, n_jobs))
+
+def _analyze_ip_chunk(ips: List[str]) -> Dict[str, any]:
     res = {
         "total": len(ips),
         "valid": 0,
@@ -258,28 +413,29 @@ def analyze_ips(ips: List[str]) -> Dict[str, any]:
         "unroutable_reserved": 0,
         "examples_invalid": [],
     }
+    # Validate row by row, then classify every valid address at once as uint32
+    fullmatch = IPV4_RE.fullmatch
+    valid = []
     for s in ips:
-        try:
-            ip = ipaddress.IPv4Address(s)  # IPv4 only, per your generator
-        except Exception:
+        if isinstance(s, str) and fullmatch(s) is not None:
+            valid.append(s)
+        else:
             res["invalid"] += 1
             if len(res["examples_invalid"]) < 5:
                 res["examples_invalid"].append(s)
-            continue
-
-        res["valid"] += 1
-        if is_private_ipv4(ip):
-            res["private"] += 1
-            if ip in RFC1918_RANGES[0]:
-                res["classA_private"] += 1
-            elif ip in RFC1918_RANGES[1]:
-                res["classB_private"] += 1
-            elif ip in RFC1918_RANGES[2]:
-                res["classC_private"] += 1
-        else:
-            res["public"] += 1
-            if is_unroutable_or_reserved(ip):
-                res["unroutable_reserved"] += 1
+    res["valid"] = len(valid)
+    if not valid:
+        return res
+
+    u32 = _ipv4_to_u32(valid)
+
+    private = _in_ranges(u32, RFC1918_NETS, RFC1918_MASKS)
+    is_private = private.any(axis=1)
+    res["private"] = int(is_private.sum())
+    res["classA_private"], res["classB_private"], res["classC_private"] = (int(x) for x in private.sum(axis=0))
+    res["public"] = res["valid"] - res["private"]
+    unroutable = _in_ranges(u32[~is_private], UNROUTABLE_NETS, UNROUTABLE_MASKS).any(axis=1)
+    res["unroutable_reserved"] = int(unroutable.sum())
     return res
 
 def print_ip_report(analysis: Dict[str, any], cfg: Optional[IPConfig]):
@@ -347,17 +503,16 @@ def print_ip_report(analysis: Dict[str, any], cfg: Optional[IPConfig]):
 # Test runners
 # ================================
 def run_url_tests(sample_size: int = 3000, seed: Optional[int] = 1337):
-    if seed is not None:
-        random.seed(seed)
-
+    # The seed goes to the generator, which draws from its own random.Random(seed)
+    # instead of the shared module-level RNG
     t0 = time.perf_counter()
     try:
-        urls = generate_urls(sample_size)  # preferred signature
+        urls = generate_urls(sample_size, seed=seed)  # preferred signature
     except TypeError:
         # fallback: call with no args and replicate to requested size
         urls = generate_urls()
         if not isinstance(urls, list) or len(urls) < sample_size:
-            urls = (urls * math.ceil(sample_size / max(1, len(urls))))[:sample_size]
+            urls = list(islice(cycle(urls), sample_size))
     t1 = time.perf_counter()
 
     analysis = analyze_urls(urls)
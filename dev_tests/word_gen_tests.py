@@ -1,9 +1,11 @@
 import os
 import sys
+import tempfile
 import unittest
-from collections import Counter
 import importlib.util
 
+import numpy as np
+
 # ---------------- Import shim (works from dev_tests/) ----------------
 THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 ROOT_DIR = os.path.abspath(os.path.join(THIS_DIR, os.pardir))
@@ -33,44 +35,36 @@ except Exception:
 def two_prefix(w: str) -> str:
     return w[:2] if len(w) >= 2 else w
 
+def prefix_array(words):
+    """2-char prefixes as a numpy '<U2' array; compute once and pass to the metrics below."""
+    return np.array([w[:2] for w in words], dtype="<U2")
+
+def _prefixes(words):
+    return words if isinstance(words, np.ndarray) else prefix_array(words)
+
 def avg_run_length(words):
     """Average run-length of consecutive identical 2-char prefixes."""
-    if not words:
+    prefs = _prefixes(words)
+    if len(prefs) == 0:
         return 0.0
-    prev = two_prefix(words[0])
-    run = 1
-    runs = []
-    for w in words[1:]:
-        p = two_prefix(w)
-        if p == prev:
-            run += 1
-        else:
-            runs.append(run)
-            run = 1
-            prev = p
-    runs.append(run)
-    return sum(runs) / len(runs)
+    num_runs = np.count_nonzero(prefs[1:] != prefs[:-1]) + 1
+    return float(len(prefs) / num_runs)
 
 def neighbor_same_prefix_ratio(words):
     """Fraction of positions i>0 where prefix[i] == prefix[i-1]."""
-    if len(words) < 2:
+    prefs = _prefixes(words)
+    if len(prefs) < 2:
         return 0.0
-    num_same = 0
-    prev = two_prefix(words[0])
-    for w in words[1:]:
-        p = two_prefix(w)
-        if p == prev:
-            num_same += 1
-        prev = p
-    return num_same / (len(words) - 1)
+    return float(np.count_nonzero(prefs[1:] == prefs[:-1]) / (len(prefs) - 1))
 
 def prefix_hhi(words):
     """Herfindahl-Hirschman index over 2-char prefixes; higher => more concentrated."""
-    n = len(words)
+    prefs = _prefixes(words)
+    n = len(prefs)
     if n == 0:
         return 0.0
-    counts = Counter(two_prefix(w) for w in words)
-    return sum((c / n) ** 2 for c in counts.values())
+    _, counts = np.unique(prefs, return_counts=True)
+    return float(np.sum((counts / n) ** 2))
 
 
 # ---------------------------------- Tests ----------------------------------
@@ -120,6 +114,8 @@ class TestPrefixFrequencyGenerator(unittest.TestCase):
         low = gen_words_with_prefix_freq(n, prefix_freq=0.0, seed=123, unique=False)
         high = gen_words_with_prefix_freq(n, prefix_freq=0.8, seed=123, unique=False)
 
+        low, high = prefix_array(low), prefix_array(high)
+
         arl_low = avg_run_length(low)
         arl_high = avg_run_length(high)
         self.assertGreater(arl_high, max(arl_low * 3.0, 3.0))  # robust gap
@@ -151,5 +147,29 @@ class TestPrefixFrequencyGenerator(unittest.TestCase):
             gen_words_with_prefix_freq(0, prefix_freq=0.3, seed=1, unique=False)
 
 
+
+class TestWordList(unittest.TestCase):
+    def _word_list(self, data: bytes):
+        from components.work_loads.words_data import WordList
+        f = tempfile.NamedTemporaryFile(delete=False)
+        f.write(data)
+        f.close()
+        self.addCleanup(os.unlink, f.name)
+        return WordList(f.name)
+
+    def test_tolist_matches_offsets(self):
+        # Only '\n' separates words; other Unicode line breaks stay inside a word
+        data = "ab\fcd\r\n\r\nef\u2028gh\n\nij\x85\x1c\n".encode("utf-8")
+        wl = self._word_list(data)
+        self.assertEqual(wl.tolist(), ["ab\fcd", "ef\u2028gh", "ij\x85\x1c"])
+        self.assertEqual(wl.tolist(), [wl[i] for i in range(len(wl))])
+        self.assertEqual(wl.tolist(), wl.take(np.arange(len(wl))))
+
+    def test_empty_file(self):
+        wl = self._word_list(b"")
+        self.assertEqual(len(wl), 0)
+        self.assertEqual(wl.tolist(), [])
+
+
 if __name__ == "__main__":
     unittest.main(verbosity=2)
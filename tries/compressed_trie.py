@@ -11,10 +11,15 @@ Key features
 ------------
 - **Space efficiency**
   - Nodes use `__slots__` and defer allocating children until needed.
-  - Outgoing edges are stored adaptively:
-    - small fanout → list of `(label, child)` tuples
-    - large fanout → dict mapping `first_char -> (label, child)`
+  - Outgoing edges are stored as parallel `labels` / `children` lists, indexed
+    adaptively by first character:
+    - small fanout → `keys` string, one char per edge (`str.find` lookup);
+      like ART's Node4/Node16 key arrays, one memchr covers up to 16 keys
+    - large fanout → `keys` dict mapping `first_char -> slot` (the Node48/Node256
+      role: O(1) lookup once a key scan would no longer be a single probe)
   - The switch threshold is controlled by the module constant `fanout_switch`.
+  - Labels of at most `intern_max_len` chars are interned, so the many repeated
+    short suffixes ("s", "ing", "com") share one string object.
 - **Normalization-aware API**
   - All public methods accept an optional `normalize` callable (default:
     `str.casefold`) so callers can consistently case-fold / normalize Unicode.
@@ -32,12 +37,18 @@ Key features
 Classes
 -------
 RadixNode
-    Internal node type. Holds `edges` (None | list | dict) and `is_terminal`.
+    Internal node type. Holds `keys` (None | str | dict), the parallel `labels`
+    and `children` lists (None on leaves), and `is_terminal`. No per-edge tuple
+    is stored; `keys` maps a first character to its slot in both lists.
     Helper methods:
+      - `_slot(ch)` → index of the edge starting with `ch`, or -1
       - `_get(ch)` → `(label, child)` for the edge whose label starts with `ch`
       - `_set(label, child)` → insert/replace by first character
       - `_del(ch)` → delete edge by first character
-      - `_iter_edges()` → iterate `(label, child)` pairs
+      - `_acquire(pool, is_terminal)` / `_release(pool)` → reuse nodes via a trie's free list
+      - `_split_here(slot, at, tail, pool)` → split an edge in place (insert)
+      - `_absorb_child(in_label, child)` → merge a unary child upward (delete)
+      - `_edges_view()` (alias `_iter_edges()`) → `(label, child)` pairs
       - `_degree()` → number of outgoing edges
       - `_only_edge()` → `(label, child)` if exactly one child, else None
       
@@ -50,8 +61,11 @@ Public API (high level)
     Normalize and (optionally) sort/deduplicate a batch.
 - `single_insert(word, normalize=str.casefold)`
     Insert one word; splits edges as needed (Patricia behavior).
+- `CompressedTrie.from_sorted(words, normalize=str.casefold)`
+    Build a new trie bottom-up from sorted input in a single pass.
 - `batch_insert(words, *, normalize=str.casefold, dedup=True, presorted=False)`
-    Insert many words efficiently after a single preparation pass.
+    Insert many words efficiently after a single preparation pass; each word
+    resumes from the path it shares with the previous (sorted) word.
 - `single_delete(word, normalize=str.casefold)`
     Delete one word; prunes empty nodes and **coalesces** unary non-terminal
     nodes by concatenating their edge labels upward.
@@ -63,6 +77,11 @@ Public API (high level)
     matching edge label.
 - `search(word, normalize=str.casefold)`
     Return the terminal node if `word` exists; else `None`.
+- `to_path_decomposed()` / `search_frozen(word, normalize=str.casefold)`
+    Build a read-only heavy-path-decomposed layout and test membership on it.
+- `freeze(max_nesting=40)`
+    Generate and install a specialized `search` for a read-mostly trie; any
+    insert/delete reverts to the generic walk.
 - `enumerate_prefix(prefix, k=None, normalize=str.casefold)`
     Generator that streams words beginning with `prefix` using iterative DFS and
     a shared mutable buffer. Handles mid-edge prefixes correctly. Yields up to
@@ -83,8 +102,9 @@ Conventions & invariants
 ------------------------
 - **Edge invariant:** At any node, no two outgoing edges share the same first
   character. This enables O(1) candidate selection by first char in dict mode.
-- **Children container:** `edges` is `None` for leaves; a list or dict otherwise.
-  `_iter_edges()` yields in container order (insertion order in practice).
+- **Children container:** `keys`/`labels`/`children` are `None` for leaves.
+  `_edges_view()` yields in slot order (insertion order, except that a dict-mode
+  delete moves the last edge into the freed slot).
 - **Normalization:** If you pass `presorted=True` to batch methods, the inputs
   must be sorted under the **same** normalization you pass in.
 - **Empty string:** If `""` is inserted, the root’s `is_terminal` represents it.
@@ -92,103 +112,181 @@ Conventions & invariants
 """
 
 
-fanout_switch = 8
+from sys import intern
+
+fanout_switch = 16
+small_batch = 32
+intern_max_len = 8   # Labels up to this length are interned (shared suffixes like "ing")
+node_pool_max = 4096   # Nodes freed by deletes are kept for reuse, up to this many per trie
 
 class RadixNode:
-  __slots__ = ("edges", "is_terminal")
+  __slots__ = ("keys", "labels", "children", "is_terminal")
   
   def __init__(self, is_terminal=False):
-    self.edges = None
+    self.keys = None
+    self.labels = None
+    self.children = None
     self.is_terminal = is_terminal
+
+
+  @classmethod
+  def _acquire(cls, pool, is_terminal=False):
+    """Return a blank node, reusing one from the `pool` free list when available."""
+    if pool:
+      node = pool.pop()
+      node.is_terminal = is_terminal
+      return node
+    return cls(is_terminal)
+
+
+  def _release(self, pool):
+    """Blank this detached node and return it to the `pool` free list if there is room."""
+    self.keys = self.labels = self.children = None
+    self.is_terminal = False
+    if len(pool) < node_pool_max:
+      pool.append(self)
     
 
+  def _slot(self, ch):
+    """Return the index of the edge whose label starts with ch, or -1."""
+    keys = self.keys
+    if keys is None:
+      return -1
+    if isinstance(keys, dict):
+      return keys.get(ch, -1)
+    return keys.find(ch)
+
+
   def _get(self, ch):
     """Return (label, child) or None for the edge whose label starts with ch."""
-    e = self.edges
-    if e is None:
-      return None
-    if isinstance(e, dict): 
-      return e.get(ch)
-
-    for key, child in e:
-      if key[0] == ch:
-        return (key, child)
-    return None
+    i = self._slot(ch)
+    return (self.labels[i], self.children[i]) if i >= 0 else None
 
 
   def _set(self, chars, child):
     """Insert/replace edge by its first char."""
-    e = self.edges
+    if len(chars) <= intern_max_len:
+      chars = intern(chars)
     ch = chars[0]
+    keys = self.keys
     
-    if e is None:
-      self.edges = [(chars, child)]
+    if keys is None:
+      self.keys = ch
+      self.labels = [chars]
+      self.children = [child]
       return
-    if isinstance(e, dict):
-      e[ch] = (chars, child)
+
+    i = self._slot(ch)
+    if i >= 0:
+      self.labels[i] = chars
+      self.children[i] = child
       return
-      
-    for i, (k, v) in enumerate(e):
-      if k[0] == ch:
-        e[i] = (chars, child)
-        break
-    else:
-      e.append((chars, child))
-      if len(e) >= fanout_switch:   # Promotion to dict
-        self.edges = {k[0]: (k, child) for k, child in e}
+    labels = self.labels
+    labels.append(chars)
+    self.children.append(child)
+    if isinstance(keys, dict):
+      keys[ch] = len(labels) - 1
+      return
+    keys += ch
+    if len(keys) >= fanout_switch:   # Promotion to dict
+      keys = {c: i for i, c in enumerate(keys)}
+    self.keys = keys
 
 
   def _del(self, char):
     """Delete edge by first char; return True if deleted."""
-    e = self.edges
-    if e is None:
+    keys = self.keys
+    if keys is None:
       return False
+    labels, children = self.labels, self.children
 
-    if isinstance(e, dict):
-      if char in e:
-        del e[char]
-        if len(e) <= fanout_switch - 2:  # Demotion to list
-          self.edges = list(e.values())
-        return True
+    if isinstance(keys, dict):
+      i = keys.pop(char, -1)
+      if i < 0:
+        return False
+      last = len(labels) - 1
+      if i != last:   # Move the last edge into the hole
+        labels[i] = labels[last]
+        children[i] = children[last]
+        keys[labels[i][0]] = i
+      labels.pop()
+      children.pop()
+      if len(keys) <= fanout_switch - 2:  # Demotion to list
+        self.keys = "".join([k[0] for k in labels])
+      return True
+
+    i = keys.find(char)
+    if i < 0:
       return False
+    labels.pop(i)
+    children.pop(i)
+    if not labels:
+      self.keys = self.labels = self.children = None
+    else:
+      self.keys = keys[:i] + keys[i + 1:]
+    return True
 
-    for i, (k, v) in enumerate(e):
-      if k[0] == char:
-        e.pop(i)
-        if not e:
-          self.edges = None
-        return True
-    return False
 
+  def _split_here(self, slot, at, tail, pool):
+    """Split edge `slot` after `at` chars and return the new intermediate node.
 
-  def _iter_edges(self):
-    """Yield (label, child) for all outgoing edges."""
-    e = self.edges
-    if not e: 
-      return
-    if isinstance(e, dict):
-      for chars, child in e.values():
-        yield (chars, child)
+    The intermediate node is built with its edges in place: the old label's
+    remainder to the old child (slot 0), plus a terminal edge for `tail` in slot
+    1 if non-empty (otherwise the node itself is terminal). Two edges never reach
+    `fanout_switch`, and the split edge keeps its first char, so neither node
+    needs a `_set`. New nodes come from the owning trie's `pool`.
+    """
+    label = self.labels[slot]
+    rest = label[at:]
+    if len(rest) <= intern_max_len:
+      rest = intern(rest)
+    if tail and len(tail) <= intern_max_len:
+      tail = intern(tail)
+    acquire = RadixNode._acquire
+    mid = acquire(pool, not tail)
+    if tail:
+      mid.keys = rest[0] + tail[0]
+      mid.labels = [rest, tail]
+      mid.children = [self.children[slot], acquire(pool, True)]
     else:
-      yield from e
+      mid.keys = rest[0]
+      mid.labels = [rest]
+      mid.children = [self.children[slot]]
+    self.labels[slot] = intern(label[:at]) if at <= intern_max_len else label[:at]
+    self.children[slot] = mid
+    return mid
+
+
+  def _absorb_child(self, in_label, child):
+    """Merge unary `child` (reached via `in_label`) into this node's edge."""
+    label, grand = child._only_edge()
+    i = self._slot(in_label[0])
+    label = in_label + label
+    if len(label) <= intern_max_len:
+      label = intern(label)
+    self.labels[i] = label
+    self.children[i] = grand
+
+
+  def _edges_view(self):
+    """Return (label, child) pairs over the edge lists, or () for a leaf; no generator."""
+    if self.labels is None:
+      return ()
+    return zip(self.labels, self.children)
+
+  _iter_edges = _edges_view
 
 
   def _degree(self):
-    e = self.edges
-    return 0 if not e else len(e)
+    labels = self.labels
+    return 0 if labels is None else len(labels)
 
   def _only_edge(self):
     """Return (label, child) if exactly one outgoing edge; else None."""
-    e = self.edges
-    if not e:
+    labels = self.labels
+    if labels is None or len(labels) != 1:
       return None
-    if isinstance(e, dict):
-      if len(e) == 1:
-        return next(iter(e.values()))
-      return None
-    if len(e) == 1:
-      return e[0]
-    return None
+    return labels[0], self.children[0]
 
 
 
@@ -200,18 +298,31 @@ class RadixNode:
 #### ===================================================  ####
 
 class CompressedTrie:
-  __slots__ = ("root", )
+  __slots__ = ("root", "_scratch", "_frozen", "_paths", "_pool")
   
   def __init__(self):
     self.root = RadixNode()
+    self._scratch = ([], [], [])   # enumerate_prefix buffer + DFS stacks, reused
+    self._frozen = None            # generated search from freeze(), if any
+    self._paths = None             # to_path_decomposed() layout, if built
+    self._pool = []                # free list of RadixNodes released by deletes
 
 
   @staticmethod
-  def _lcp(a, b):
-    """Helper to Return the length of the Longest Common Prefix between a and b."""
+  def _lcp(a, b, start=0):
+    """Helper to Return the length of the Longest Common Prefix between a[start:] and b.
+
+    A full match of `b` (the usual case when descending an edge) is one C-level
+    `startswith`; otherwise 8-char blocks are compared before the per-char tail.
+    `start` lets callers walk a key by offset instead of slicing it per edge.
+    """
+    if a.startswith(b, start):
+      return len(b)
+    n = min(len(a) - start, len(b))
     i = 0
-    n = min(len(a), len(b))
-    while i < n and a[i] == b[i]:
+    while i + 8 < n and a[start + i:start + i + 8] == b[i:i + 8]:
+      i += 8
+    while i < n and a[start + i] == b[i]:
       i += 1
     return i
 
@@ -234,26 +345,33 @@ class CompressedTrie:
     presorted : bool, default=False
     If True, `words` is already sorted under *the same* `normalize` rule.
     When True + dedup, we do a stable O(n) pass to remove duplicates.
+    Unsorted batches of at most `small_batch` words take the same pass after an
+    in-place sort instead of hashing everything into a set.
   
     Returns
     -------
     list[str]
     Normalized (and possibly sorted/deduplicated) words ready for batch ops.
     """
-    items = (normalize(w) for w in words)
+    items = [normalize(w) for w in words]
   
     if not presorted:
-      return sorted(set(items)) if dedup else sorted(items)
-  
-    if dedup:
-      unique = []
-      last = None
-      for w in items:
-        if w != last:
-          unique.append(w)
-          last = w
-      return unique
-    return list(items)
+      if not dedup:
+        items.sort()
+        return items
+      if len(items) > small_batch:
+        return sorted(set(items))
+      items.sort()   # Small batch: sort in place and dedup below, no set
+    elif not dedup:
+      return items
+
+    unique = []
+    last = None
+    for w in items:
+      if w != last:
+        unique.append(w)
+        last = w
+    return unique
 
 
   def single_insert(self, word, normalize=str.casefold):
@@ -278,40 +396,80 @@ class CompressedTrie:
     """
     if normalize is not None:
       word = normalize(word)
+    self._frozen = self._paths = None
     node = self.root
+    pos, n = 0, len(word)
+    RN = RadixNode
+    _slot = RN._slot
+    lcp = self._lcp
 
-    while word:
-      RN = RadixNode
-      nxt = node._get(word[0])
-      if nxt is None:
-        node._set(word, RadixNode(True))
+    while pos < n:
+      j = _slot(node, word[pos])
+      if j < 0:
+        node._set(word[pos:], RN._acquire(self._pool, True))
         return
         
-      label, child = nxt
-      i = self._lcp(word, label)
+      label = node.labels[j]
+      i = lcp(word, label, pos)
       if i == len(label):
-        word = word[i:]
-        node = child
+        pos += i
+        node = node.children[j]
         continue
-      if i > 0:
-        shared, old, new = label[:i], label[i:], word[i:]
-        mid = RN(is_terminal=(new == ""))
-        node._set(shared, mid)
-        mid._set(old, child)
-        if new:
-          mid._set(new, RN(True))
-        return
-      node._set(word, RN(True))   # Fall back
+      node._split_here(j, i, word[pos + i:], self._pool)   # i > 0: the first char matched
       return
     node.is_terminal = True
   
 
 
   def batch_insert(self, words, *, normalize=str.casefold, dedup=True, presorted=False):
-    """Insert a single word into the compressed trie."""
+    """Insert many words, resuming each descent where the previous word's path diverges.
+
+    After preparation the batch is sorted, so neighbours share long prefixes.
+    The nodes on the previous word's path are kept on a stack with their depths;
+    each word pops back to the deepest node inside its common prefix with the
+    previous word and descends from there instead of from the root. Splits only
+    happen below that node, so the kept path stays valid.
+    """
     words = self._prepare_batch(words, normalize, dedup, presorted)
-    for w in words:
-      self.single_insert(w, normalize=None)
+    self._frozen = self._paths = None
+    lcp = self._lcp
+    RN = RadixNode
+    _slot = RN._slot
+    path = [self.root]
+    depths = [0]
+    prev = ""
+
+    for word in words:
+      cp = lcp(word, prev)
+      while depths[-1] > cp:
+        path.pop()
+        depths.pop()
+      node = path[-1]
+      pos, n = depths[-1], len(word)
+
+      while pos < n:
+        j = _slot(node, word[pos])
+        if j < 0:
+          child = RN._acquire(self._pool, True)
+          node._set(word[pos:], child)
+          node, pos = child, n
+        else:
+          label = node.labels[j]
+          i = lcp(word, label, pos)
+          if i < len(label):
+            node = node._split_here(j, i, word[pos + i:], self._pool)
+            pos += i
+            if pos < n:   # Keep the split node, then step to the new tail leaf
+              path.append(node)
+              depths.append(pos)
+              node, pos = node.children[1], n
+          else:
+            node = node.children[j]
+            pos += i
+        path.append(node)
+        depths.append(pos)
+      node.is_terminal = True
+      prev = word
 
 
 
@@ -328,6 +486,8 @@ class CompressedTrie:
       * coalesce (merge) unary, non-terminal nodes by concatenating their sole edge
         labels into the parent’s incoming edge (multi-level).
     - Special case: deleting the empty string "" unmarks the root if it is terminal.
+    - Pruned and merged-away nodes go back to this trie's free list (`_pool`), so a
+      node returned by an earlier `search` must not be held across a delete.
 
     Args:
         word (str): Key to delete.
@@ -340,6 +500,7 @@ class CompressedTrie:
         O(L + P), where L = len(word) and P = number of nodes pruned/merged."""
     if normalize is not None:
       word = normalize(word)
+    self._frozen = self._paths = None
     if word == "":
       if self.root.is_terminal:
           self.root.is_terminal = False
@@ -347,24 +508,21 @@ class CompressedTrie:
       return False
 
     node = self.root
-    rem = word
+    pos, n = 0, len(word)
     frames = []
-    lcp = self._lcp
     _get = RadixNode._get
-    _set = RadixNode._set
     _del = RadixNode._del
 
-    while rem:
-      hit = _get(node, rem[0])
+    while pos < n:
+      hit = _get(node, word[pos])
       if hit is None:
         return False
       label, child = hit
-      i = lcp(rem, label)
-      if i < len(label):
+      if not word.startswith(label, pos):
         return False
       frames.append((node, label, child))
       node = child
-      rem = rem[i:]
+      pos += len(label)
 
     if not node.is_terminal:
       return False
@@ -378,20 +536,20 @@ class CompressedTrie:
 
       deg = cur._degree()
       if deg == 1:
-        only = cur._only_edge()
-        child_label, grand = only
-        _set(parent, in_label + child_label, grand)
-        cur = parent
-        while frames and not cur.is_terminal and cur._degree() == 1:
-          gp, gp_edge, _ = frames.pop()
-          only2 = cur._only_edge()
-          child_label, grand_child = only2
-          _set(gp, gp_edge + child_label, grand_child)
-          cur = gp
+        # Collect the labels of any unary chain above, then merge once at its top
+        pieces = [in_label]
+        top = parent
+        while frames and not top.is_terminal and top._degree() == 1:
+          top, top_label, _ = frames.pop()
+          pieces.append(top_label)
+        pieces.reverse()
+        top._absorb_child("".join(pieces), cur)
+        cur._release(self._pool)
         return True
         
       if deg == 0:
         _del(parent, in_label[0])
+        cur._release(self._pool)
         cur = parent
         continue
       break
@@ -399,6 +557,69 @@ class CompressedTrie:
 
 
 
+  @classmethod
+  def from_sorted(cls, words, normalize=str.casefold):
+    """Build a trie in one pass from words sorted under `normalize`.
+
+    Keeps the frontier (the path of the last word) as parallel node/depth
+    stacks. Since input is sorted, each new word branches off that path: the
+    frontier is popped back to the common prefix with the previous word, the
+    last edge there is split if the prefix ends inside it, and the new suffix
+    is appended as a leaf. No word descends from the root and nodes left
+    behind the frontier are never revisited. Duplicates are skipped.
+
+    Args:
+        words (Iterable[str]): Words in ascending order after normalization.
+        normalize (Callable[[str], str] | None): Optional normalizer (default: str.casefold).
+
+    Returns:
+        CompressedTrie: A new trie holding `words`.
+
+    Raises:
+        ValueError: If a word sorts before its predecessor.
+    """
+    trie = cls()
+    lcp = cls._lcp
+    acquire = RadixNode._acquire
+    pool = trie._pool
+    nodes = [trie.root]
+    depths = [0]
+    prev = None
+
+    for word in words:
+      if normalize is not None:
+        word = normalize(word)
+      if prev is None:
+        prev = ""
+        if not word:
+          trie.root.is_terminal = True
+          continue
+      elif word <= prev:
+        if word == prev:
+          continue
+        raise ValueError("from_sorted requires words sorted under `normalize`")
+
+      # word > prev, so it is never a prefix of prev: cp < len(word)
+      cp = lcp(word, prev)
+      while depths[-1] > cp:
+        nodes.pop()
+        depths.pop()
+      node = nodes[-1]
+      d = depths[-1]
+      if d < cp:   # prev's edge out of `node` runs past cp: split it there
+        mid = node._split_here(len(node.labels) - 1, cp - d, word[cp:], pool)
+        nodes.append(mid)
+        depths.append(cp)
+        leaf = mid.children[1]
+      else:
+        leaf = acquire(pool, True)
+        node._set(word[cp:], leaf)
+      nodes.append(leaf)
+      depths.append(len(word))
+      prev = word
+    return trie
+
+
   def batch_delete(self, words, *, normalize=str.casefold, dedup=True, presorted=False):
     """Delete many words; returns (deleted_count, missing_count)."""
     words = self._prepare_batch(words, normalize, dedup, presorted)
@@ -445,32 +666,177 @@ class CompressedTrie:
       return self.root, ""
       
     node = self.root
-    lcp = self._lcp
-    while prefix:
-      hit = node._get(prefix[0])
+    pos, n = 0, len(prefix)
+    while pos < n:
+      hit = node._get(prefix[pos])
       if hit is None:
         return None, ""
       label, child = hit
-      i = lcp(prefix, label)
-      
-      if i == len(label):
-        prefix = prefix[i:]
-        node = child
-        continue
-        
-      if i == len(prefix):
-        return child, label[i:]
-      return None, ""
+
+      if n - pos < len(label):   # Prefix ends inside this edge
+        rest = prefix[pos:]
+        if label.startswith(rest):
+          return child, label[len(rest):]
+        return None, ""
+      if not prefix.startswith(label, pos):
+        return None, ""
+      pos += len(label)
+      node = child
     return node, ""
 
 
   def search(self, word, normalize=str.casefold):
     """Return the terminal node for `word` if present, else None.
     """
+    frozen = self._frozen
+    if frozen is not None:
+      if normalize is not None:
+        word = normalize(word)
+      return frozen(word, len(word))
     node, suffix = self.prefix_search(word, normalize)
     return node if node and node.is_terminal and suffix == "" else None
 
 
+  def freeze(self, max_nesting=40):
+    """Compile a `search` specialized to the trie's current contents.
+
+    Walks the trie once and generates Python source in which every edge is a
+    hard-coded `if c == first and w.startswith(label, offset):` branch (edge
+    offsets are constants, since they only depend on the path), then `exec`s it.
+    `search` runs that decision tree until the next insert/delete, which drops it.
+    Subtrees nested deeper than `max_nesting` go to separate generated functions
+    to stay under the parser's indentation limit.
+
+    Intended for read-mostly tries: generation is O(#nodes) and the source is
+    large (roughly 100 bytes per node), so freeze once after bulk loading.
+    """
+    nodes = []
+    out = []
+    pending = [(0, self.root, 0)]
+    nfuncs = 1
+    while pending:
+      fid, top, top_off = pending.pop()
+      out.append(f"def _f{fid}(w, n):")
+      stack = [(top, top_off, 1)]
+      while stack:
+        item = stack.pop()
+        if item.__class__ is str:
+          out.append(item)
+          continue
+        node, off, lvl = item
+        ind = " " * lvl
+        ret = "None"
+        if node.is_terminal:
+          ret = f"_n[{len(nodes)}]"
+          nodes.append(node)
+        if node.labels is None:
+          out.append(f"{ind}return {ret} if n == {off} else None")
+          continue
+        out.append(f"{ind}if n == {off}: return {ret}")
+        out.append(f"{ind}c = w[{off}]")
+        stack.append(f"{ind}return None")
+        for label, child in zip(reversed(node.labels), reversed(node.children)):
+          end = off + len(label)
+          if lvl >= max_nesting:
+            stack.append(f"{ind} return _f{nfuncs}(w, n)")
+            pending.append((nfuncs, child, end))
+            nfuncs += 1
+          else:
+            stack.append((child, end, lvl + 1))
+          if len(label) == 1:
+            stack.append(f"{ind}if c == {label!r}:")
+          else:
+            stack.append(f"{ind}if c == {label[0]!r} and w.startswith({label!r}, {off}):")
+    namespace = {"_n": nodes}
+    exec(compile("\n".join(out), "<frozen CompressedTrie>", "exec"), namespace)
+    self._frozen = namespace["_f0"]
+
+
+  def to_path_decomposed(self):
+    """Build a read-only, heavy-path-decomposed copy of the trie for `search_frozen`.
+
+    Each root-to-leaf path that always follows the child with the largest
+    subtree is flattened into one string; every other child starts a new path
+    whose string begins with its edge label. A lookup compares the query against
+    a whole path with one LCP and only jumps when it leaves that path, which
+    happens O(log n) times instead of once per edge. No node objects are kept.
+
+    Returns
+    -------
+    tuple[list[str], dict[int, int], set[int]]
+        `(paths, branches, terminals)`: the path strings (path 0 starts at the
+        root); `branches` maps `(pid << 32 | offset) << 21 | ord(char)` to the
+        path id of the light edge leaving path `pid` at `offset` with `char`;
+        `terminals` holds `pid << 32 | offset` wherever a stored word ends. The
+        layout is cached until the next insert/delete.
+    """
+    # Subtree sizes, children before parents
+    order = []
+    stack = [self.root]
+    while stack:
+      node = stack.pop()
+      order.append(node)
+      if node.children is not None:
+        stack.extend(node.children)
+    size = {}
+    for node in reversed(order):
+      children = node.children
+      size[node] = 1 if children is None else 1 + sum([size[c] for c in children])
+
+    paths = [None]
+    branches = {}
+    terminals = set()
+    stack = [(0, self.root, "")]
+    while stack:
+      pid, node, text = stack.pop()
+      base = pid << 32
+      pieces = [text]
+      off = len(text)
+      if node.is_terminal:
+        terminals.add(base | off)
+      while node.children is not None:
+        labels, children = node.labels, node.children
+        sizes = [size[c] for c in children]
+        h = sizes.index(max(sizes))
+        for j, label in enumerate(labels):
+          if j != h:
+            branches[(base | off) << 21 | ord(label[0])] = len(paths)
+            stack.append((len(paths), children[j], label))
+            paths.append(None)
+        pieces.append(labels[h])
+        off += len(labels[h])
+        node = children[h]
+        if node.is_terminal:
+          terminals.add(base | off)
+      paths[pid] = "".join(pieces)
+    self._paths = (paths, branches, terminals)
+    return self._paths
+
+
+  def search_frozen(self, word, normalize=str.casefold):
+    """Return True if `word` is stored, using the path-decomposed layout.
+
+    Builds the layout with `to_path_decomposed()` on first use after a change.
+    """
+    if normalize is not None:
+      word = normalize(word)
+    layout = self._paths
+    if layout is None:
+      layout = self.to_path_decomposed()
+    paths, branches, terminals = layout
+    lcp = self._lcp
+    pid = pos = 0
+    n = len(word)
+    while True:
+      m = lcp(word, paths[pid], pos)
+      if pos + m == n:
+        return (pid << 32 | m) in terminals
+      pid = branches.get((pid << 32 | m) << 21 | ord(word[pos + m]))
+      if pid is None:
+        return False
+      pos += m
+
+
   def count_nodes(self, get_avg_branch_factor=False):
     """Return total node count, or average branching factor over internal nodes.
 
@@ -495,16 +861,14 @@ class CompressedTrie:
     total_deg = 0
 
     stack = [self.root]
+    push = stack.extend
     while stack:
-      node = stack.pop()
+      children = stack.pop().children
       total_nodes += 1
-
-      deg = node._degree()
-      if deg > 0:
-        total_deg += deg
+      if children is not None:
+        total_deg += len(children)
         internal += 1
-        for _, child in (node._iter_edges()):
-          stack.append(child)
+        push(children)
     if get_avg_branch_factor:
       return (total_deg / internal) if internal else 0.0
     return total_nodes
@@ -514,13 +878,16 @@ class CompressedTrie:
   def enumerate_prefix(self, prefix, k=None, normalize=str.casefold):
     """Enumerate all words that start with `prefix` using an iterative DFS.
 
-    - Optionally normalizes `prefix`, then uses `prefix_search` to locate the start:
-      if the prefix ends mid-edge, appends the pending edge suffix to a mutable
-      buffer before traversal.
+    - Optionally normalizes `prefix`, then descends to it with the same walk as
+      `prefix_search` (inlined, no intermediate call or tuple): if the prefix ends
+      mid-edge, appends the pending edge suffix to a mutable buffer before traversal.
     - If the starting position corresponds to a stored word (after applying the
       pending suffix, if any), yields that word, then explores descendants.
-    - Traverses without recursion using a stack of `(node, child_iterator, depth)`,
-      extending the shared buffer with each edge label and restoring it on backtrack.
+    - Traverses without recursion using parallel stacks of nodes and integer edge
+      cursors (no iterators, no StopIteration). The buffer holds one label per
+      open frame and is truncated to the frame's depth on backtrack; leaves are
+      yielded without being pushed. The buffer and stacks are reused across calls
+      (not thread-safe; a concurrent enumeration on the same trie allocates its own).
     - Yields up to `k` matches when `k` is provided; otherwise streams all matches.
     - Output order follows the nodes’ child iteration order (insertion order);
       this method does not impose lexicographic sorting.
@@ -545,42 +912,75 @@ class CompressedTrie:
 
     if normalize is not None:
       prefix = normalize(prefix)
-    node, suffix = self.prefix_search(prefix, normalize=None)
-    if node is None:
-      return
     if k is not None and k <= 0:
       return
 
-    buf = list(prefix)
-    yielded = 0
-    if suffix or node.is_terminal:
-      buf.extend(suffix)
+    # Descend to the prefix inline (same walk as `prefix_search`)
+    node = self.root
+    suffix = ""
+    pos, n = 0, len(prefix)
+    while pos < n:
+      hit = node._get(prefix[pos])
+      if hit is None:
+        return
+      label, node = hit
+      if n - pos < len(label):
+        rest = prefix[pos:]
+        if not label.startswith(rest):
+          return
+        suffix = label[len(rest):]
+        break
+      if not prefix.startswith(label, pos):
+        return
+      pos += len(label)
+
+    # Borrow the instance's scratch lists; a nested or interleaved enumeration
+    # finds them lent out and allocates its own.
+    scratch = self._scratch
+    self._scratch = None
+    if scratch is None:
+      scratch = ([], [], [])
+    buf, nodes, cursors = scratch
+    try:
+      # buf holds label pieces: prefix, pending suffix, then one per open frame
+      buf.append(prefix)
+      buf.append(suffix)
+      yielded = 0
       if node.is_terminal:
-        yield "".join(buf)
+        yield prefix + suffix
         if k is not None:
           yielded += 1
           if yielded >= k:
             return
 
-    _iter = RadixNode._iter_edges
-    to_str = "".join
-    stack = [(node, _iter(node), len(buf))]
-    
-    while stack:
-      node, children, depth = stack[-1]
-      try:
-        buf[depth:] = []
-        label, child = next(children)
-        buf.extend(label)
+      to_str = "".join
+      if node.labels is not None:
+        nodes.append(node)
+        cursors.append(0)
+
+      while nodes:
+        top = nodes[-1]
+        c = cursors[-1]
+        labels = top.labels
+        if c >= len(labels):
+          nodes.pop()
+          cursors.pop()
+          continue
+        cursors[-1] = c + 1
+        child = top.children[c]
+        del buf[len(nodes) + 1:]
+        buf.append(labels[c])
         if child.is_terminal:
           yield to_str(buf)
           if k is not None:
             yielded += 1
             if yielded >= k:
               return
-        stack.append((child, _iter(child), len(buf)))
-      except StopIteration:
-        stack.pop()
-    return
-    
-
+        if child.labels is not None:   # Leaves are never pushed
+          nodes.append(child)
+          cursors.append(0)
+    finally:
+      buf.clear()
+      nodes.clear()
+      cursors.clear()
+      self._scratch = scratch
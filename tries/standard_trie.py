@@ -34,9 +34,11 @@ Conventions & Notes
 -------------------
 - **Normalization:** All mutating/read methods accept `normalize`. If you pass
   `presorted=True`, the input must already be sorted according to the *same*
-  normalization you pass here.
+  normalization you pass here. Pass `normalize=None` when inputs are already
+  normalized upstream; they are then used as-is, with no per-string call.
 - **Children:** `children` is `None` for leaves; create the dict only when adding
-  the first child. Always guard with `if node.children: ...`.
+  the first child. Always guard with `if node.children: ...`. Keys are interned
+  on insert, so every edge for the same character shares one `str` object.
 - **Enumeration order:** By default follows child insertion order. If you need
   lexicographic output, sort keys at visitation time in your caller.
 - **Deletion semantics:** Deleting a non-present word increments `missing_count`;
@@ -46,6 +48,10 @@ Conventions & Notes
   will represent it; enumeration will yield `""` when appropriate.
     """
 
+from itertools import islice
+from sys import intern
+
+
 class TrieNode:
   __slots__ = ("children", "is_terminal")
 
@@ -55,10 +61,11 @@ class TrieNode:
 
 
 class Trie:
-  __slots__ = ("root", )
+  __slots__ = ("root", "_node_count")
 
   def __init__(self):
     self.root = TrieNode()
+    self._node_count = 1   # Kept current by every insert/delete path
 
   def _prepare_batch(self,
                      words,
@@ -71,8 +78,9 @@ class Trie:
     ----------
     words : Iterable[str]
         Incoming words to process.
-    normalize : Callable[[str], str], default=str.casefold
+    normalize : Callable[[str], str] | None, default=str.casefold
         Normalization function applied to each element (e.g., case folding).
+        None means the words are already normalized and are used as-is.
     dedup : bool, default=True
         Remove duplicates within the batch.
     presorted : bool, default=False
@@ -88,7 +96,9 @@ class Trie:
     ----------
     O(n log n) when sorting; O(n) when `presorted=True`.
     """
-    items = (normalize(w) for w in words)
+    # map() drives the calls from C: no generator frame resumed per element,
+    # and the default str.casefold runs as a plain method descriptor
+    items = iter(words) if normalize is None else map(normalize, words)
 
     if not presorted:
       return sorted(set(items)) if dedup else sorted(items)
@@ -103,6 +113,37 @@ class Trie:
       return unique
     return list(items)
 
+
+  def _walk_sorted(self, words):
+    """Yield `(word, i, path)` for each word of a sorted batch.
+
+    `path` is one list shared across the whole walk: on each yield it holds the
+    nodes for `word[:i]`, i.e. the prefix shared with the previous word, with
+    `path[-1]` the node to resume from. The caller extends it as it descends
+    the rest of the word, and the next step truncates it in place.
+
+    Shared by `batch_insert` and `batch_delete`, which differ only in what
+    they do below the shared prefix.
+    """
+    prev = ''
+    path = [self.root]
+
+    for w in words:
+      # LCP with the previous word; zip pairs the characters in C and stops
+      # at the shorter string, so no bounds checks or indexing per step
+      i = 0
+      for a, b in zip(prev, w):
+        if a != b:
+          break
+        i += 1
+
+      # A failed delete descent leaves the path shorter than the LCP
+      if i >= len(path):
+        i = len(path) - 1
+      del path[i + 1:]
+      yield w, i, path
+      prev = w
+
   
   def single_insert(self, word, normalize=str.casefold):
     """Insert a single word into the trie.
@@ -111,44 +152,86 @@ class Trie:
     ----------
     word : str
         Word to insert.
-    normalize : Callable[[str], str], default=str.casefold
-        Normalization applied before insertion.
+    normalize : Callable[[str], str] | None, default=str.casefold
+        Normalization applied before insertion; None if already normalized.
 
     Notes
     -----
     - Lazily creates the `children` dict only when a node gets its first child.
+    - Existing edges are taken with a plain `children[ch]`; a miss costs one
+      `KeyError`, after which the rest of the word hangs off fresh leaves.
     - Marks the terminal node's `is_terminal=True` at the end of the path.
 
     Complexity
     ----------
     O(L) time, O(new_nodes) space where L = len(word).
     """
-    word = normalize(word)
+    if normalize is not None:
+      word = normalize(word)
     node = self.root
+    added = 0
 
     for w in word:
       children = node.children
-      nxt = None if children is None else children.get(w)
-      if nxt is None:
+      if children is None:
         nxt = TrieNode()
-        if children is None:
-            node.children = {w: nxt}
-        else:
-            children[w] = nxt
-      node = nxt
+        node.children = {intern(w): nxt}
+        node = nxt
+        added += 1
+        continue
+      try:
+        node = children[w]
+      except KeyError:
+        node = children[intern(w)] = TrieNode()
+        added += 1
     node.is_terminal = True
+    self._node_count += added
 
   
   def single_delete(self, word, normalize=str.casefold):
     """Delete a single word from the trie.
 
+    Returns
+    -------
+    bool
+        True if `word` was present and removed, else False.
+
     Implementation detail
     ---------------------
-    Delegates to `batch_delete` with `dedup=False, presorted=True` to reuse the
-    robust pruning logic.
+    Walks the word once, recording the nodes on the path, then unmarks the
+    terminal and prunes upward the same way `batch_delete` does, without the
+    batch preparation and LCP bookkeeping.
     """
-    deleted, _ = self.batch_delete([word], normalize=normalize, dedup=False, presorted=True)
-    return deleted == 1
+    if normalize is not None:
+      word = normalize(word)
+    node = self.root
+    path = [node]
+
+    for ch in word:
+      children = node.children
+      if children is None:
+        return False
+      node = children.get(ch)
+      if node is None:
+        return False
+      path.append(node)
+
+    if not node.is_terminal:
+      return False
+    node.is_terminal = False
+
+    pruned = 0
+    for idx in range(len(path) - 1, 0, -1):
+      cur = path[idx]
+      if cur.is_terminal or cur.children:
+        break
+      parent = path[idx - 1]
+      del parent.children[word[idx - 1]]
+      if not parent.children:
+        parent.children = None
+      pruned += 1
+    self._node_count -= pruned
+    return True
 
   
   def batch_insert(self,
@@ -179,34 +262,28 @@ class Trie:
     """
     words = self._prepare_batch(words, normalize, dedup, presorted)
 
-    prev = ''
-    path = [self.root]
-
-    for w in words:
-      lp, lw = len(prev), len(w)
-      i = 0
-      while i < lp and i < lw and prev[i] == w[i]:
-        i += 1
+    added = 0
 
-      path = path[:i + 1]
+    for w, i, path in self._walk_sorted(words):
       node = path[-1]
 
       for char in w[i:]:
         children = node.children
-        nxt = None if children is None else children.get(char)
-
-        if nxt is None:
+        if children is None:
           nxt = TrieNode()
-          if children is None:
-              node.children = {char: nxt}
-          else:
-              children[char] = nxt
+          node.children = {intern(char): nxt}
+          added += 1
+        else:
+          nxt = children.get(char)
+          if nxt is None:
+            nxt = children[intern(char)] = TrieNode()
+            added += 1
 
         path.append(nxt)
         node = nxt
 
       node.is_terminal = True
-      prev = w
+    self._node_count += added
 
   
 
@@ -243,22 +320,11 @@ class Trie:
     """
     words = self._prepare_batch(words, normalize, dedup, presorted)
 
-    prev = ""
-    path_nodes = [self.root]  
-    path_edges = [""] 
-
     deleted = 0
     missing = 0
+    pruned = 0
 
-    for w in words:
-      i = 0
-      lp, lw = len(prev), len(w)
-      while i < lp and i < lw and prev[i] == w[i]:
-        i += 1
-
-      path_nodes = path_nodes[:i + 1]
-      path_edges = path_edges[:i + 1]
-
+    for w, i, path_nodes in self._walk_sorted(words):
       node = path_nodes[-1]
       ok = True
       for ch in w[i:]:
@@ -268,11 +334,9 @@ class Trie:
           break
         node = children[ch]
         path_nodes.append(node)
-        path_edges.append(ch)
 
       if not ok or not node.is_terminal:
         missing += 1
-        prev = w
         continue
 
       node.is_terminal = False
@@ -287,15 +351,17 @@ class Trie:
         if children_cur and len(children_cur) > 0:
           break
 
+        # A found word was walked in full, so path_nodes[idx] hangs off w[idx - 1]
         parent = path_nodes[idx - 1]
-        edge_ch = path_edges[idx]
+        edge_ch = w[idx - 1]
 
         if parent.children:
           parent.children.pop(edge_ch, None)
           if len(parent.children) == 0:
             parent.children = None
+        pruned += 1
         idx -= 1
-      prev = w
+    self._node_count -= pruned
     return deleted, missing
     
 
@@ -306,7 +372,7 @@ class Trie:
     ----------
     prefix : str
         Prefix to locate.
-    normalize : Callable[[str], str], default=str.casefold
+    normalize : Callable[[str], str] | None, default=str.casefold
 
     Returns
     -------
@@ -334,6 +400,125 @@ class Trie:
     return node if node and node.is_terminal else None
 
   
+  def compile_search(self, normalize=str.casefold, max_nesting=40):
+    """Compile the trie's current contents into a membership test.
+
+    Parameters
+    ----------
+    normalize : Callable[[str], str] | None, default=str.casefold
+        Applied to each queried word inside the compiled function.
+    max_nesting : int, default=40
+        Subtrees deeper than this go to separate generated functions to stay
+        under the parser's indentation limit.
+
+    Returns
+    -------
+    Callable[[str], bool]
+        `match(word)` that is True exactly when `search(word)` would find it.
+
+    Notes
+    -----
+    Generates Python source whose control flow mirrors the trie and `exec`s
+    it: a branching node becomes `c = w[i]` followed by one `if c == ...:`
+    per child, and each run of non-terminal single-child nodes collapses into
+    one `w.startswith(label, i)` test. Offsets are constants, so no node
+    objects are touched at query time.
+
+    The result is a snapshot: later inserts and deletes are not reflected.
+    Generation is O(#nodes) and the source is large, so compile once after
+    bulk loading a read-only set. Enumeration stays on the trie itself.
+    """
+    out = []
+    pending = [(0, self.root, 0)]
+    nfuncs = 1
+    while pending:
+      fid, top, top_off = pending.pop()
+      if fid == 0:
+        out.append("def _f0(w):")
+        if normalize is not None:
+          out.append(" w = _norm(w)")
+        out.append(" n = len(w)")
+      else:
+        out.append(f"def _f{fid}(w, n):")
+      stack = [(top, top_off, 1)]
+      while stack:
+        item = stack.pop()
+        if item.__class__ is str:
+          out.append(item)
+          continue
+        node, off, lvl = item
+        ind = " " * lvl
+        children = node.children
+        if not children:
+          # Only the root can be a non-terminal leaf (empty trie)
+          out.append(f"{ind}return n == {off}" if node.is_terminal else f"{ind}return False")
+          continue
+        out.append(f"{ind}if n == {off}: return {node.is_terminal}")
+
+        # Collapse each child's run of non-terminal, single-child nodes
+        edges = []
+        for ch, child in children.items():
+          label = ch
+          while not child.is_terminal and len(child.children) == 1:
+            (nxt_ch, child), = child.children.items()
+            label += nxt_ch
+          edges.append((label, child))
+
+        stack.append(f"{ind}return False")
+        if len(edges) > 1:
+          out.append(f"{ind}c = w[{off}]")
+        for label, child in reversed(edges):
+          end = off + len(label)
+          if lvl >= max_nesting:
+            stack.append(f"{ind} return _f{nfuncs}(w, n)")
+            pending.append((nfuncs, child, end))
+            nfuncs += 1
+          else:
+            stack.append((child, end, lvl + 1))
+          if len(edges) == 1 and len(label) == 1:
+            stack.append(f"{ind}if w[{off}] == {label!r}:")
+          elif len(edges) == 1:
+            stack.append(f"{ind}if w.startswith({label!r}, {off}):")
+          elif len(label) == 1:
+            stack.append(f"{ind}if c == {label!r}:")
+          else:
+            stack.append(f"{ind}if c == {label[0]!r} and w.startswith({label!r}, {off}):")
+    namespace = {"_norm": normalize}
+    exec(compile("\n".join(out), "<compiled Trie>", "exec"), namespace)
+    return namespace["_f0"]
+
+  
+  def _iter_words(self, node, prefix):
+    """Yield every word at or below `node`, where `prefix` spells out `node`.
+
+    Shared DFS behind `enumerate_prefix` and `list_prefix`. Each stack frame
+    carries the string spelled out to its node; a child's word is that string
+    plus one character, so a match is yielded as-is with no per-result join
+    over the whole path.
+    """
+    if node.is_terminal:
+      yield prefix
+
+    # Each frame is (children iterator, word spelled to its node). Leaves are
+    # never pushed, and items() hands over the child with its edge character.
+    # A frame's `for` resumes where it left off; descending breaks out of it,
+    # and exhaustion falls through to `else` without a Python-level exception.
+    stack = [(iter(node.children.items()), prefix)] if node.children else []
+
+    while stack:
+      it, spelled = stack[-1]
+      for ch, child in it:
+        word = spelled + ch
+        if child.is_terminal:
+            yield word
+        children = child.children
+        if children:
+            stack.append((iter(children.items()), word))
+            break
+      else:
+        stack.pop()
+
+
   def enumerate_prefix(self, prefix, k=None, normalize=str.casefold):
     """Yield words that start with `prefix` using an iterative DFS.
 
@@ -343,7 +528,7 @@ class Trie:
         The prefix to enumerate from. Use "" to export the entire trie.
     k : int | None, default=None
         If None, yield all matches; otherwise, yield up to `k` matches.
-    normalize : Callable[[str], str], default=str.casefold
+    normalize : Callable[[str], str] | None, default=str.casefold
 
     Yields
     ------
@@ -352,52 +537,55 @@ class Trie:
 
     Implementation details
     ----------------------
-    - Uses a shared mutable character buffer to minimize intermediate string
-      allocations; only joins to a Python string at yield time.
-    - Traversal order follows child insertion order. Sort keys in `child_iter`
-      if lexicographic order is required.
+    - The traversal itself lives in `_iter_words`; this method only resolves
+      the prefix node and applies the `k` cutoff.
+    - Traversal order follows child insertion order. Sort each node's children
+      before pushing its iterator if lexicographic order is required.
     """
-    prefix = normalize(prefix)
-    node = self.prefix_search(prefix, normalize)
+    if normalize is not None:
+      prefix = normalize(prefix)
+    node = self.prefix_search(prefix, None)
     if node is None:
       return
+    words = self._iter_words(node, prefix)
+    if k is not None:
+      words = islice(words, max(k, 1))
+    yield from words
+    
 
-    yielded = 0
-    buf = list(prefix)
+  def list_prefix(self, prefix, k=None, normalize=str.casefold):
+    """Return the words that start with `prefix` as a list.
 
-    def child_iter(n):
-      if not n.children:
-          return iter(())
-      keys = n.children.keys()
-      return iter(keys)
+    Parameters
+    ----------
+    prefix : str
+        The prefix to enumerate from. Use "" to export the entire trie.
+    k : int | None, default=None
+        If None, return all matches; otherwise, return up to `k` matches.
+    normalize : Callable[[str], str] | None, default=str.casefold
 
-    if node.is_terminal:
-      yield "".join(buf)
-      if k is not None:
-          yielded += 1
-          if yielded >= k:
-              return
+    Returns
+    -------
+    list[str]
+        The same words, in the same order, as `enumerate_prefix`.
 
-    stack = [(node, child_iter(node), len(buf))]
+    Notes
+    -----
+    Drains `_iter_words` with a single `list()` call, skipping the extra
+    generator layer `enumerate_prefix` adds for the caller. Use it when every
+    match will be consumed; use `enumerate_prefix` to stream results or stop
+    early without building the list.
+    """
+    if normalize is not None:
+      prefix = normalize(prefix)
+    node = self.prefix_search(prefix, None)
+    if node is None:
+      return []
+    words = self._iter_words(node, prefix)
+    if k is not None:
+      words = islice(words, max(k, 1))
+    return list(words)
 
-    while stack:
-      n, it, depth = stack[-1]
-      try:
-          ch = next(it)                
-          child = n.children[ch]
-          buf.append(ch)                 
-          if child.is_terminal:
-              yield "".join(buf)
-              if k is not None:
-                  yielded += 1
-                  if yielded >= k:
-                      return
-          stack.append((child, child_iter(child), len(buf)))
-      except StopIteration:
-          stack.pop()       
-          buf[depth-1:] = []   
-    return
-    
 
   def count_nodes(self, get_avg_branch_factor=False):
     """Return total node count, or average branching factor over internal nodes.
@@ -416,23 +604,23 @@ class Trie:
 
     Complexity
     ----------
-    O(#nodes) time, O(depth) extra space.
+    O(1) for the total, which inserts and deletes keep in `_node_count`;
+    O(#nodes) time, O(depth) extra space for the branching factor.
     """
-    total_nodes = 0
+    if not get_avg_branch_factor:
+      return self._node_count
+
     internal = 0
     total_deg = 0
     
     stack = [self.root]
     while stack:
       node = stack.pop()
-      total_nodes += 1
       children = node.children
       if children:
         total_deg += len(children)
         internal += 1
         stack.extend(children.values())
-    if get_avg_branch_factor:
-      return (total_deg / internal) if internal else 0.0
-    return total_nodes
+    return (total_deg / internal) if internal else 0.0
 
 